@@ -23,7 +23,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     Platform,
 )
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
@@ -61,6 +61,7 @@ from .const import (
     CONF_MIN_CONDUCTIVITY,
     CONF_MIN_MOISTURE,
     CONF_MIN_TEMPERATURE,
+    DATA_PLANTS,
     DATA_SOURCE,
     DOMAIN,
     DOMAIN_PLANTBOOK,
@@ -135,6 +136,33 @@ SERVICE_REPLACE_SENSOR_SCHEMA = vol.Schema(
 SETUP_DUMMY_SENSORS = False
 USE_DUMMY_SENSORS = False
 
+# PlantDevice attributes (meter, min, max, status, trigger) for the measurements
+# checked against both thresholds in PlantDevice.update()
+_THRESHOLD_CHECKS = tuple(
+    (
+        f"sensor_{name}",
+        f"min_{name}",
+        f"max_{name}",
+        f"{name}_status",
+        f"{name}_trigger",
+    )
+    for name in (
+        "moisture",
+        "conductivity",
+        "temperature",
+        "humidity",
+        "co2",
+        "soil_temperature",
+    )
+)
+_ILLUMINANCE_CHECK = (
+    "sensor_illuminance",
+    "min_illuminance",
+    "max_illuminance",
+    "illuminance_status",
+    "illuminance_trigger",
+)
+
 
 @callback
 def _async_find_matching_config_entry(hass: HomeAssistant) -> ConfigEntry | None:
@@ -193,6 +221,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     plant = PlantDevice(hass, entry)
     hass.data[DOMAIN][entry.entry_id][ATTR_PLANT] = plant
+    # Flat entry_id -> plant index, so lookups don't scan every domain key
+    hass.data[DOMAIN].setdefault(DATA_PLANTS, {})[entry.entry_id] = plant
 
     # Register update listener for options flow
     entry.async_on_unload(entry.add_update_listener(update_plant_options))
@@ -224,17 +254,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         """Replace a sensor entity within a plant device."""
         meter_entity = call.data[ATTR_METER_ENTITY]
         new_sensor = call.data.get(ATTR_NEW_SENSOR)
-        found = False
-        for entry_id in hass.data[DOMAIN]:
-            # Skip internal settings keys
-            if entry_id.startswith("_") or entry_id.endswith("_store"):
-                continue
-            if ATTR_SENSORS in hass.data[DOMAIN][entry_id]:
-                for sensor in hass.data[DOMAIN][entry_id][ATTR_SENSORS]:
-                    if sensor.entity_id == meter_entity:
-                        found = True
-                        break
-        if not found:
+        meter = next(
+            (
+                sensor
+                for plant in hass.data[DOMAIN].get(DATA_PLANTS, {}).values()
+                for sensor in plant.meter_entities
+                if sensor is not None and sensor.entity_id == meter_entity
+            ),
+            None,
+        )
+        if meter is None:
             _LOGGER.warning(
                 "Refuse to update non-%s entities: %s", DOMAIN, meter_entity
             )
@@ -248,11 +277,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             return False
 
         try:
-            meter = hass.states.get(meter_entity)
+            meter_state = hass.states.get(meter_entity)
         except AttributeError:
             _LOGGER.error("Meter entity %s not found", meter_entity)
             return False
-        if meter is None:
+        if meter_state is None:
             _LOGGER.error("Meter entity %s not found", meter_entity)
             return False
 
@@ -273,15 +302,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             meter_entity,
             new_sensor,
         )
-        for key in hass.data[DOMAIN]:
-            # Skip internal settings keys
-            if key.startswith("_") or key.endswith("_store"):
-                continue
-            if ATTR_SENSORS in hass.data[DOMAIN][key]:
-                meters = hass.data[DOMAIN][key][ATTR_SENSORS]
-                for meter in meters:
-                    if meter.entity_id == meter_entity:
-                        meter.replace_external_sensor(new_sensor)
+        meter.replace_external_sensor(new_sensor)
         return
 
     hass.services.async_register(
@@ -390,6 +411,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data[DOMAIN].get(DATA_PLANTS, {}).pop(entry.entry_id, None)
         hass.data[DATA_UTILITY].pop(entry.entry_id, None)
         _LOGGER.debug("Remaining domain data: %s", list(hass.data[DOMAIN].keys()))
 
@@ -456,31 +478,31 @@ def ws_get_info(
         )
         return
 
-    for key in hass.data[DOMAIN]:
-        # Skip internal settings keys
-        if key.startswith("_") or key.endswith("_store"):
-            continue
-        if ATTR_PLANT not in hass.data[DOMAIN][key]:
-            continue
-        plant_entity = hass.data[DOMAIN][key][ATTR_PLANT]
-        if plant_entity.entity_id == msg["entity_id"]:
-            try:
-                connection.send_result(
-                    msg["id"], {"result": plant_entity.websocket_info}
-                )
-            except Exception as e:
-                _LOGGER.warning(
-                    "Error getting plant info for %s: %s",
-                    msg["entity_id"],
-                    e,
-                    exc_info=True,
-                )
-                connection.send_error(msg["id"], "plant_info_error", str(e))
-            return
-    connection.send_error(
-        msg["id"], "entity_not_found", f"Entity {msg['entity_id']} not found"
+    entity_id = msg["entity_id"]
+    plant_entity = next(
+        (
+            plant
+            for plant in hass.data[DOMAIN].get(DATA_PLANTS, {}).values()
+            if plant.entity_id == entity_id
+        ),
+        None,
     )
-    return
+    if plant_entity is None:
+        connection.send_error(
+            msg["id"], "entity_not_found", f"Entity {entity_id} not found"
+        )
+        return
+
+    try:
+        connection.send_result(msg["id"], {"result": plant_entity.websocket_info})
+    except Exception as e:
+        _LOGGER.warning(
+            "Error getting plant info for %s: %s",
+            entity_id,
+            e,
+            exc_info=True,
+        )
+        connection.send_error(msg["id"], "plant_info_error", str(e))
 
 
 class PlantDevice(Entity):
@@ -524,6 +546,12 @@ class PlantDevice(Entity):
 
         self.plant_complete = False
         self._device_id = None
+        # Registry icon overrides, dropped again on entity registry updates
+        self._icon_cache: dict[str, str | None] = {}
+        # Built on first read, cleared whenever statuses or species change
+        self._attributes_cache: dict | None = None
+        # Inputs and results of the last update(), so unchanged polls can be skipped
+        self._last_update: tuple | None = None
 
         self._check_days = None
 
@@ -654,7 +682,9 @@ class PlantDevice(Entity):
         if not self.plant_complete:
             # We are not fully set up, so we just return an empty dict for now
             return {}
-        attributes = {
+        if self._attributes_cache is not None:
+            return self._attributes_cache
+        self._attributes_cache = {
             ATTR_SPECIES: self.display_species,
             f"{ATTR_MOISTURE}_status": self.moisture_status,
             f"{ATTR_TEMPERATURE}_status": self.temperature_status,
@@ -666,15 +696,15 @@ class PlantDevice(Entity):
             f"{ATTR_DLI}_status": self.dli_status,
             f"{ATTR_SPECIES}_original": self.species,
         }
-        return attributes
+        return self._attributes_cache
 
     def _get_entity_icon(self, entity: Entity) -> str | None:
         """Get icon for entity, preferring user customization from entity registry."""
-        entity_registry = er.async_get(self.hass)
-        entry = entity_registry.async_get(entity.entity_id)
-        if entry and entry.icon:
-            return entry.icon
-        return entity.icon
+        entity_id = entity.entity_id
+        if entity_id not in self._icon_cache:
+            entry = er.async_get(self.hass).async_get(entity_id)
+            self._icon_cache[entity_id] = entry.icon if entry else None
+        return self._icon_cache[entity_id] or entity.icon
 
     def _sensor_available(self, sensor) -> bool:
         """Check if a sensor entity is available for websocket reporting."""
@@ -847,6 +877,7 @@ class PlantDevice(Entity):
     def add_species(self, species: Entity | None) -> None:
         """Set new species"""
         self.species = species
+        self._attributes_cache = None
 
     def add_thresholds(
         self,
@@ -1010,7 +1041,8 @@ class PlantDevice(Entity):
             _LOGGER.debug("Sensor %s has non-numeric value: %s", entity_id, value)
             return None
 
-    def _check_threshold(self, value, min_entity, max_entity, current_status):
+    @staticmethod
+    def _check_threshold(value, min_entity, max_entity, current_status):
         """Check a value against min/max thresholds with hysteresis.
 
         Returns STATE_LOW, STATE_HIGH, or STATE_OK.
@@ -1056,163 +1088,86 @@ class PlantDevice(Entity):
             )
         return new_status
 
-    def update(self) -> None:
-        """Run on every update of the entities"""
-
-        new_state = STATE_OK
-        known_state = False
-
-        if self.sensor_moisture is not None:
-            moisture = getattr(
-                self.hass.states.get(self.sensor_moisture.entity_id), "state", None
-            )
-            moisture_val = self._safe_float(moisture, self.sensor_moisture.entity_id)
-            if moisture_val is not None:
-                known_state = True
-                self.moisture_status = self._check_threshold(
-                    moisture_val,
-                    self.min_moisture,
-                    self.max_moisture,
-                    self.moisture_status,
+    def _collect_update_inputs(self) -> tuple:
+        """Return the readings, thresholds and triggers update() reads."""
+        states_get = self.hass.states.get
+        inputs = []
+        for sensor_attr, min_attr, max_attr, _, trigger_attr in (
+            *_THRESHOLD_CHECKS,
+            _ILLUMINANCE_CHECK,
+        ):
+            sensor = getattr(self, sensor_attr)
+            inputs.append(
+                (
+                    sensor and sensor.entity_id,
+                    sensor and getattr(states_get(sensor.entity_id), "state", None),
+                    getattr(getattr(self, min_attr), "state", None),
+                    getattr(getattr(self, max_attr), "state", None),
+                    getattr(self, trigger_attr),
                 )
-                if (
-                    self.moisture_status in (STATE_LOW, STATE_HIGH)
-                    and self.moisture_trigger
-                ):
-                    new_state = STATE_PROBLEM
-            else:
-                # Reset status when sensor is unavailable or non-numeric
-                self.moisture_status = None
-        else:
-            # Reset status when sensor is removed
-            self.moisture_status = None
-
-        if self.sensor_conductivity is not None:
-            conductivity = getattr(
-                self.hass.states.get(self.sensor_conductivity.entity_id), "state", None
-            )
-            conductivity_val = self._safe_float(
-                conductivity, self.sensor_conductivity.entity_id
             )
-            if conductivity_val is not None:
-                known_state = True
-                self.conductivity_status = self._check_threshold(
-                    conductivity_val,
-                    self.min_conductivity,
-                    self.max_conductivity,
-                    self.conductivity_status,
+        if self.dli is not None:
+            inputs.append(
+                (
+                    self.dli.native_value,
+                    self.dli.extra_state_attributes.get("last_period"),
+                    getattr(self.min_dli, "state", None),
+                    getattr(self.max_dli, "state", None),
                 )
-                if (
-                    self.conductivity_status in (STATE_LOW, STATE_HIGH)
-                    and self.conductivity_trigger
-                ):
-                    new_state = STATE_PROBLEM
-            else:
-                # Reset status when sensor is unavailable or non-numeric
-                self.conductivity_status = None
-        else:
-            # Reset status when sensor is removed
-            self.conductivity_status = None
-
-        if self.sensor_temperature is not None:
-            temperature = getattr(
-                self.hass.states.get(self.sensor_temperature.entity_id), "state", None
-            )
-            temperature_val = self._safe_float(
-                temperature, self.sensor_temperature.entity_id
             )
-            if temperature_val is not None:
-                known_state = True
-                self.temperature_status = self._check_threshold(
-                    temperature_val,
-                    self.min_temperature,
-                    self.max_temperature,
-                    self.temperature_status,
-                )
-                if (
-                    self.temperature_status in (STATE_LOW, STATE_HIGH)
-                    and self.temperature_trigger
-                ):
-                    new_state = STATE_PROBLEM
-            else:
-                # Reset status when sensor is unavailable or non-numeric
-                self.temperature_status = None
-        else:
-            # Reset status when sensor is removed
-            self.temperature_status = None
+        inputs.append((self.dli_trigger, self._is_ppfd_source()))
+        return tuple(inputs)
+
+    def _collect_update_results(self) -> tuple:
+        """Return the statuses and plant state update() writes."""
+        return (
+            *(getattr(self, check[3]) for check in _THRESHOLD_CHECKS),
+            self.illuminance_status,
+            self.dli_status,
+            self._attr_state,
+        )
 
-        if self.sensor_humidity is not None:
-            humidity = getattr(
-                self.hass.states.get(self.sensor_humidity.entity_id), "state", None
-            )
-            humidity_val = self._safe_float(humidity, self.sensor_humidity.entity_id)
-            if humidity_val is not None:
-                known_state = True
-                self.humidity_status = self._check_threshold(
-                    humidity_val,
-                    self.min_humidity,
-                    self.max_humidity,
-                    self.humidity_status,
-                )
-                if (
-                    self.humidity_status in (STATE_LOW, STATE_HIGH)
-                    and self.humidity_trigger
-                ):
-                    new_state = STATE_PROBLEM
-            else:
-                # Reset status when sensor is unavailable or non-numeric
-                self.humidity_status = None
-        else:
-            # Reset status when sensor is removed
-            self.humidity_status = None
+    def update(self) -> None:
+        """Run on every update of the entities"""
 
-        if self.sensor_co2 is not None:
-            co2 = getattr(
-                self.hass.states.get(self.sensor_co2.entity_id), "state", None
-            )
-            co2_val = self._safe_float(co2, self.sensor_co2.entity_id)
-            if co2_val is not None:
-                known_state = True
-                self.co2_status = self._check_threshold(
-                    co2_val, self.min_co2, self.max_co2, self.co2_status
-                )
-                if self.co2_status in (STATE_LOW, STATE_HIGH) and self.co2_trigger:
-                    new_state = STATE_PROBLEM
-            else:
-                # Reset status when sensor is unavailable or non-numeric
-                self.co2_status = None
-        else:
-            # Reset status when sensor is removed
-            self.co2_status = None
+        # With hysteresis a status only depends on the inputs and on itself,
+        # so unchanged inputs on top of the previous results are a no-op
+        update_inputs = self._collect_update_inputs()
+        if (update_inputs, self._collect_update_results()) == self._last_update:
+            return
 
-        if self.sensor_soil_temperature is not None:
-            soil_temp = getattr(
-                self.hass.states.get(self.sensor_soil_temperature.entity_id),
-                "state",
-                None,
-            )
-            soil_temp_val = self._safe_float(
-                soil_temp, self.sensor_soil_temperature.entity_id
-            )
-            if soil_temp_val is not None:
-                known_state = True
-                self.soil_temperature_status = self._check_threshold(
-                    soil_temp_val,
-                    self.min_soil_temperature,
-                    self.max_soil_temperature,
-                    self.soil_temperature_status,
+        new_state = STATE_OK
+        known_state = False
+        states_get = self.hass.states.get
+
+        for (
+            sensor_attr,
+            min_attr,
+            max_attr,
+            status_attr,
+            trigger_attr,
+        ) in _THRESHOLD_CHECKS:
+            sensor = getattr(self, sensor_attr)
+            # Status is reset when the sensor is removed, unavailable or non-numeric
+            status = None
+            if sensor is not None:
+                value = self._safe_float(
+                    getattr(states_get(sensor.entity_id), "state", None),
+                    sensor.entity_id,
                 )
-                if (
-                    self.soil_temperature_status in (STATE_LOW, STATE_HIGH)
-                    and self.soil_temperature_trigger
-                ):
-                    new_state = STATE_PROBLEM
-            else:
-                # Reset status when sensor is unavailable or non-numeric
-                self.soil_temperature_status = None
-        else:
-            # Reset status when sensor is removed
-            self.soil_temperature_status = None
+                if value is not None:
+                    known_state = True
+                    status = self._check_threshold(
+                        value,
+                        getattr(self, min_attr),
+                        getattr(self, max_attr),
+                        getattr(self, status_attr),
+                    )
+                    if status in (STATE_LOW, STATE_HIGH) and getattr(
+                        self, trigger_attr
+                    ):
+                        new_state = STATE_PROBLEM
+            setattr(self, status_attr, status)
 
         # Check the instant values for illuminance against "max"
         # Ignoring "min" value for illuminance as it would probably trigger every night
@@ -1225,7 +1180,7 @@ class PlantDevice(Entity):
                 self.illuminance_status = None
             else:
                 illuminance = getattr(
-                    self.hass.states.get(self.sensor_illuminance.entity_id),
+                    states_get(self.sensor_illuminance.entity_id),
                     "state",
                     None,
                 )
@@ -1254,20 +1209,14 @@ class PlantDevice(Entity):
 
         # - Checking Low values would create "problem" every night...
         # Check DLI from the previous day against max/min DLI
-        if (
-            self.dli is not None
-            and self.dli.native_value is not None
-            and self.dli.native_value != STATE_UNKNOWN
-            and self.dli.native_value != STATE_UNAVAILABLE
-        ):
+        dli_native = self.dli.native_value if self.dli is not None else None
+        if dli_native not in (None, STATE_UNKNOWN, STATE_UNAVAILABLE):
             known_state = True
+            last_period = self.dli.extra_state_attributes.get("last_period", 0)
             try:
-                dli_value = float(self.dli.extra_state_attributes.get("last_period", 0))
+                dli_value = float(last_period)
             except (ValueError, TypeError):
-                _LOGGER.debug(
-                    "DLI last_period has non-numeric value: %s",
-                    self.dli.extra_state_attributes.get("last_period"),
-                )
+                _LOGGER.debug("DLI last_period has non-numeric value: %s", last_period)
                 dli_value = 0
             if dli_value > 0:
                 self.dli_status = self._check_threshold(
@@ -1293,6 +1242,7 @@ class PlantDevice(Entity):
             )
         self._attr_state = new_state
         self.update_registry()
+        self._last_update = (update_inputs, self._collect_update_results())
 
     @property
     def data_source(self) -> str | None:
@@ -1301,6 +1251,8 @@ class PlantDevice(Entity):
 
     def update_registry(self) -> None:
         """Update registry with correct data"""
+        # Runs after every status update and options change
+        self._attributes_cache = None
         # Is there a better way to add an entity to the device registry?
 
         device_registry = dr.async_get(self.hass)
@@ -1319,3 +1271,30 @@ class PlantDevice(Entity):
 
     async def async_added_to_hass(self) -> None:
         self.update_registry()
+
+        @callback
+        def _is_cached_icon_event(
+            event_data: er.EventEntityRegistryUpdatedData,
+        ) -> bool:
+            """Only let through registry events about entities with a cached icon."""
+            return (
+                event_data["entity_id"] in self._icon_cache
+                or event_data.get("old_entity_id") in self._icon_cache
+            )
+
+        @callback
+        def _handle_entity_registry_update(
+            event: Event[er.EventEntityRegistryUpdatedData],
+        ) -> None:
+            """Drop the cached icon of an updated, renamed or removed entity."""
+            self._icon_cache.pop(event.data["entity_id"], None)
+            if "old_entity_id" in event.data:
+                self._icon_cache.pop(event.data["old_entity_id"], None)
+
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                _handle_entity_registry_update,
+                event_filter=_is_cached_icon_event,
+            )
+        )
@@ -129,6 +129,7 @@ DATA_SOURCE_PLANTBOOK = "OpenPlantbook"
 DATA_SOURCE_MANUAL = "Manual"
 DATA_SOURCE_DEFAULT = "Default values"
 DATA_UPDATED = "plant_data_updated"
+DATA_PLANTS = "_plants_by_entry"
 
 
 UNIT_PPFD = "mol/s⋅m²"
@@ -311,10 +311,12 @@ class PlantMinMax(RestoreNumber):
             self._attr_native_value = self._default_value
         # We track changes to our own state so we can update ourselves if state is changed
         # from the UI or by other means
-        async_track_state_change_event(
-            self.hass,
-            [self.entity_id],
-            self._state_changed_event,
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass,
+                self.entity_id,
+                self._state_changed_event,
+            )
         )
 
     @callback
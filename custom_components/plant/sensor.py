@@ -31,7 +31,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import (
@@ -196,7 +196,7 @@ class PlantCurrentStatus(RestoreSensor):
         self._config = config
         self._default_state = None
         self._plant = plantdevice
-        self._tracker = []
+        self._tracker: dict[str, CALLBACK_TYPE] = {}
         self._follow_external = True
         self.entity_id = async_generate_entity_id(
             f"{DOMAIN}.{{}}",
@@ -240,22 +240,20 @@ class PlantCurrentStatus(RestoreSensor):
     def replace_external_sensor(self, new_sensor: str | None) -> None:
         """Modify the external sensor and persist to config entry."""
         _LOGGER.info("Setting %s external sensor to %s", self.entity_id, new_sensor)
+        changed = new_sensor != self._external_sensor
         # pylint: disable=attribute-defined-outside-init
         self._external_sensor = new_sensor
-        self.async_track_entity(self.entity_id)
-        self.async_track_entity(self.external_sensor)
+        self._async_update_tracking()
 
         # Persist the change to config entry if we have a config key
         if self._config_key:
             self._update_config_entry(new_sensor)
 
-        self.async_write_ha_state()
+        # Restoring or re-selecting the same sensor leaves the state unchanged
+        if changed:
+            self.async_write_ha_state()
 
-        if (
-            self._plant
-            and getattr(self._plant, "plant_complete", False)
-            and not self.hass.is_stopping
-        ):
+        if self._plant.plant_complete and not self.hass.is_stopping:
             self._plant.update_entity_disabled_state(self)
 
     def _update_config_entry(self, new_sensor: str | None) -> None:
@@ -283,15 +281,29 @@ class PlantCurrentStatus(RestoreSensor):
             new_sensor,
         )
 
-    def async_track_entity(self, entity_id: str) -> None:
-        """Track state_changed of certain entities"""
-        if entity_id and entity_id not in self._tracker:
-            async_track_state_change_event(
+    @callback
+    def _async_update_tracking(self) -> None:
+        """Track state_changed of ourselves and the current external sensor"""
+        wanted = {
+            entity_id
+            for entity_id in (self.entity_id, self.external_sensor)
+            if entity_id
+        }
+        # Only touch the subscriptions that actually changed
+        for entity_id in self._tracker.keys() - wanted:
+            self._tracker.pop(entity_id)()
+        for entity_id in wanted - self._tracker.keys():
+            self._tracker[entity_id] = async_track_state_change_event(
                 self.hass,
-                [entity_id],
+                entity_id,
                 self._state_changed_event,
             )
-            self._tracker.append(entity_id)
+
+    @callback
+    def _async_untrack_all(self) -> None:
+        """Remove all state_changed subscriptions"""
+        while self._tracker:
+            self._tracker.popitem()[1]()
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
@@ -322,15 +334,24 @@ class PlantCurrentStatus(RestoreSensor):
             self.external_sensor,
             self.enabled,
         )
-        self.async_track_entity(self.entity_id)
-        if self.external_sensor:
-            self.async_track_entity(self.external_sensor)
+        self._async_update_tracking()
+        self.async_on_remove(self._async_untrack_all)
 
         async_dispatcher_connect(
             self.hass, DATA_UPDATED, self._schedule_immediate_update
         )
 
         # Listen for entity registry updates to handle entity_id changes and deletions
+        @callback
+        def _is_external_sensor_event(
+            event_data: EventEntityRegistryUpdatedData,
+        ) -> bool:
+            """Only let through registry events about our external sensor."""
+            return bool(self._external_sensor) and (
+                event_data.get("old_entity_id", event_data["entity_id"])
+                == self._external_sensor
+            )
+
         @callback
         def _handle_entity_registry_update(
             event: Event[EventEntityRegistryUpdatedData],
@@ -338,49 +359,40 @@ class PlantCurrentStatus(RestoreSensor):
             """Handle entity registry updates."""
             action = event.data["action"]
             if action == "update":
-                # Check if this is our external sensor being renamed
+                # Only a rename of our external sensor carries old_entity_id
                 if "old_entity_id" not in event.data:
                     return
-                old_entity_id = event.data["old_entity_id"]
-                new_entity_id = event.data["entity_id"]
-                if self._external_sensor and old_entity_id == self._external_sensor:
-                    _LOGGER.debug(
-                        "External sensor renamed from %s to %s, updating tracking",
-                        old_entity_id,
-                        new_entity_id,
-                    )
-                    self.replace_external_sensor(new_entity_id)
+                _LOGGER.debug(
+                    "External sensor renamed from %s to %s, updating tracking",
+                    event.data["old_entity_id"],
+                    event.data["entity_id"],
+                )
+                self.replace_external_sensor(event.data["entity_id"])
             elif action == "remove":
-                # Check if our external sensor was deleted
-                entity_id = event.data["entity_id"]
-                if self._external_sensor and entity_id == self._external_sensor:
-                    _LOGGER.info(
-                        "External sensor %s was deleted, clearing reference",
-                        entity_id,
-                    )
-                    self.replace_external_sensor(None)
+                _LOGGER.info(
+                    "External sensor %s was deleted, clearing reference",
+                    event.data["entity_id"],
+                )
+                self.replace_external_sensor(None)
 
         self.async_on_remove(
             self.hass.bus.async_listen(
                 EVENT_ENTITY_REGISTRY_UPDATED,
                 _handle_entity_registry_update,
+                event_filter=_is_external_sensor_event,
             )
         )
 
     async def async_update(self) -> None:
         """Set state and unit to the parent sensor state and unit"""
         if self.external_sensor:
+            external_state = self.hass.states.get(self.external_sensor)
             try:
-                self._attr_native_value = float(
-                    self.hass.states.get(self.external_sensor).state
-                )
-                if (
-                    ATTR_UNIT_OF_MEASUREMENT
-                    in self.hass.states.get(self.external_sensor).attributes
-                ):
-                    self._attr_native_unit_of_measurement = self.hass.states.get(
-                        self.external_sensor
-                    ).attributes[ATTR_UNIT_OF_MEASUREMENT]
+                self._attr_native_value = float(external_state.state)
+                if ATTR_UNIT_OF_MEASUREMENT in external_state.attributes:
+                    self._attr_native_unit_of_measurement = external_state.attributes[
+                        ATTR_UNIT_OF_MEASUREMENT
+                    ]
             except AttributeError:
                 _LOGGER.debug(
                     "Unknown external sensor for %s: %s, setting to default: %s",
@@ -394,7 +406,7 @@ class PlantCurrentStatus(RestoreSensor):
                     "Unknown external value for %s: %s = %s, setting to default: %s",
                     self.entity_id,
                     self.external_sensor,
-                    self.hass.states.get(self.external_sensor).state,
+                    external_state.state,
                     self._default_state,
                 )
                 self._attr_native_value = self._default_state
@@ -422,10 +434,11 @@ class PlantCurrentStatus(RestoreSensor):
     @callback
     def state_changed(self, entity_id: str | None, new_state: State | None) -> None:
         """Handle state changes from GUI and service calls."""
-        if not self.hass.states.get(self.entity_id):
+        own_state = self.hass.states.get(self.entity_id)
+        if not own_state:
             return
         if entity_id == self.entity_id:
-            current_attrs = self.hass.states.get(self.entity_id).attributes
+            current_attrs = own_state.attributes
             if current_attrs.get("external_sensor") != self.external_sensor:
                 self.replace_external_sensor(current_attrs.get("external_sensor"))
 
@@ -694,32 +707,22 @@ class PlantCurrentPpfd(PlantCurrentStatus):
 
     async def async_update(self) -> None:
         """Run on every update to allow for changes from the GUI and service call"""
-        if not self.hass.states.get(self.entity_id):
-            return
-        if self.external_sensor != self._plant.sensor_illuminance.entity_id:
-            self.replace_external_sensor(self._plant.sensor_illuminance.entity_id)
-
-        # Detect source type on each update (in case sensor changes)
-        self._source_is_ppfd = self._is_ppfd_source()
-
-        if self.external_sensor:
-            external_sensor = self.hass.states.get(self.external_sensor)
-            if external_sensor:
-                self._attr_native_value = self.ppfd(external_sensor.state)
-            else:
-                self._attr_native_value = None
-        else:
-            self._attr_native_value = None
+        self._refresh_from_source()
 
     @callback
     def state_changed(self, entity_id: str | None, new_state: State | None) -> None:
         """Handle state changes from GUI and service calls."""
+        self._refresh_from_source()
+
+    @callback
+    def _refresh_from_source(self) -> None:
+        """Follow the plant's illuminance meter and recalculate the PPFD value."""
         if not self.hass.states.get(self.entity_id):
             return
-        if self._external_sensor != self._plant.sensor_illuminance.entity_id:
+        if self.external_sensor != self._plant.sensor_illuminance.entity_id:
             self.replace_external_sensor(self._plant.sensor_illuminance.entity_id)
 
-        # Detect source type
+        # Detect source type on each update (in case sensor changes)
         self._source_is_ppfd = self._is_ppfd_source()
 
         if self.external_sensor:
@@ -793,30 +796,33 @@ class PlantTotalLightIntegral(IntegrationSensor):
         await super().async_added_to_hass()
 
         # Listen for entity registry updates to handle entity_id changes
+        @callback
+        def _is_source_rename_event(
+            event_data: EventEntityRegistryUpdatedData,
+        ) -> bool:
+            """Only let through renames of our source entity."""
+            return (
+                event_data["action"] == "update"
+                and event_data.get("old_entity_id") == self._source_entity
+            )
+
         @callback
         def _handle_entity_registry_update(
             event: Event[EventEntityRegistryUpdatedData],
         ) -> None:
             """Handle entity registry updates."""
-            if event.data["action"] != "update":
-                return
-            # Check if this is our source entity being renamed
-            if "old_entity_id" not in event.data:
-                return
-            old_entity_id = event.data["old_entity_id"]
-            new_entity_id = event.data["entity_id"]
-            if old_entity_id == self._source_entity:
-                _LOGGER.debug(
-                    "Source entity renamed from %s to %s, updating tracking",
-                    old_entity_id,
-                    new_entity_id,
-                )
-                self._update_source_entity(new_entity_id)
+            _LOGGER.debug(
+                "Source entity renamed from %s to %s, updating tracking",
+                event.data["old_entity_id"],
+                event.data["entity_id"],
+            )
+            self._update_source_entity(event.data["entity_id"])
 
         self.async_on_remove(
             self.hass.bus.async_listen(
                 EVENT_ENTITY_REGISTRY_UPDATED,
                 _handle_entity_registry_update,
+                event_filter=_is_source_rename_event,
             )
         )
 
@@ -903,30 +909,33 @@ class PlantDailyLightIntegral(UtilityMeterSensor):
         await super().async_added_to_hass()
 
         # Listen for entity registry updates to handle entity_id changes
+        @callback
+        def _is_source_rename_event(
+            event_data: EventEntityRegistryUpdatedData,
+        ) -> bool:
+            """Only let through renames of our source entity."""
+            return (
+                event_data["action"] == "update"
+                and event_data.get("old_entity_id") == self._sensor_source_id
+            )
+
         @callback
         def _handle_entity_registry_update(
             event: Event[EventEntityRegistryUpdatedData],
         ) -> None:
             """Handle entity registry updates."""
-            if event.data["action"] != "update":
-                return
-            # Check if this is our source entity being renamed
-            if "old_entity_id" not in event.data:
-                return
-            old_entity_id = event.data["old_entity_id"]
-            new_entity_id = event.data["entity_id"]
-            if old_entity_id == self._sensor_source_id:
-                _LOGGER.debug(
-                    "Source entity renamed from %s to %s, updating tracking",
-                    old_entity_id,
-                    new_entity_id,
-                )
-                self._update_source_entity(new_entity_id)
+            _LOGGER.debug(
+                "Source entity renamed from %s to %s, updating tracking",
+                event.data["old_entity_id"],
+                event.data["entity_id"],
+            )
+            self._update_source_entity(event.data["entity_id"])
 
         self.async_on_remove(
             self.hass.bus.async_listen(
                 EVENT_ENTITY_REGISTRY_UPDATED,
                 _handle_entity_registry_update,
+                event_filter=_is_source_rename_event,
             )
         )
 
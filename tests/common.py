@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any
 
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
-from custom_components.plant.const import ATTR_PLANT, ATTR_SENSORS, DOMAIN
+from custom_components.plant import PlantDevice
+from custom_components.plant.const import DOMAIN
+
+# Entity id suffix -> attributes of the mocked external sensors
+EXTERNAL_SENSOR_ATTRIBUTES: dict[str, dict[str, str]] = {
+    "temperature": {"unit_of_measurement": "°C", "device_class": "temperature"},
+    "moisture": {"unit_of_measurement": "%", "device_class": "moisture"},
+    "conductivity": {"unit_of_measurement": "µS/cm", "device_class": "conductivity"},
+    "illuminance": {"unit_of_measurement": "lx", "device_class": "illuminance"},
+    "humidity": {"unit_of_measurement": "%", "device_class": "humidity"},
+    "co2": {"unit_of_measurement": "ppm", "device_class": "carbon_dioxide"},
+    "soil_temperature": {"unit_of_measurement": "°C", "device_class": "temperature"},
+}
+
+# Readings inside every default limit from create_plant_config_data
+BASELINE_READINGS = MappingProxyType(
+    {
+        "temperature": 25.0,  # Within 10-40
+        "moisture": 40.0,  # Within 20-60
+        "conductivity": 1000.0,  # Within 500-3000
+        "illuminance": 5000.0,  # Within 0-100000
+        "humidity": 40.0,  # Within 20-60
+        "co2": 800.0,  # Within 400-2000
+        "soil_temperature": 22.0,  # Within 10-40
+    }
+)
 
 
 def get_plant_entity_ids(hass: HomeAssistant, entry_id: str) -> dict[str, list[str]]:
@@ -32,6 +59,16 @@ def get_plant_entity_ids(hass: HomeAssistant, entry_id: str) -> dict[str, list[s
     return result
 
 
+async def setup_and_wait(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Set up a config entry and assert it reached the loaded state.
+
+    Platform setup is awaited by async_setup_entry, so the entry is loaded
+    once async_setup returns and there is no need to drain the event loop.
+    """
+    await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.LOADED
+
+
 async def set_sensor_state(
     hass: HomeAssistant,
     entity_id: str,
@@ -55,56 +92,26 @@ async def set_external_sensor_states(
     co2: float | None = None,
     soil_temperature: float | None = None,
 ) -> None:
-    """Set external sensor states for testing."""
-    if temperature is not None:
-        await set_sensor_state(
-            hass,
-            "sensor.test_temperature",
-            temperature,
-            {"unit_of_measurement": "°C", "device_class": "temperature"},
-        )
-    if moisture is not None:
-        await set_sensor_state(
-            hass,
-            "sensor.test_moisture",
-            moisture,
-            {"unit_of_measurement": "%", "device_class": "moisture"},
-        )
-    if conductivity is not None:
-        await set_sensor_state(
-            hass,
-            "sensor.test_conductivity",
-            conductivity,
-            {"unit_of_measurement": "µS/cm", "device_class": "conductivity"},
-        )
-    if illuminance is not None:
-        await set_sensor_state(
-            hass,
-            "sensor.test_illuminance",
-            illuminance,
-            {"unit_of_measurement": "lx", "device_class": "illuminance"},
-        )
-    if humidity is not None:
-        await set_sensor_state(
-            hass,
-            "sensor.test_humidity",
-            humidity,
-            {"unit_of_measurement": "%", "device_class": "humidity"},
-        )
-    if co2 is not None:
-        await set_sensor_state(
-            hass,
-            "sensor.test_co2",
-            co2,
-            {"unit_of_measurement": "ppm", "device_class": "carbon_dioxide"},
-        )
-    if soil_temperature is not None:
-        await set_sensor_state(
-            hass,
-            "sensor.test_soil_temperature",
-            soil_temperature,
-            {"unit_of_measurement": "°C", "device_class": "temperature"},
-        )
+    """Set external sensor states for testing.
+
+    All states are written first and the loop is drained once afterwards,
+    so listeners see the full set of readings in a single pass.
+    """
+    readings = {
+        "temperature": temperature,
+        "moisture": moisture,
+        "conductivity": conductivity,
+        "illuminance": illuminance,
+        "humidity": humidity,
+        "co2": co2,
+        "soil_temperature": soil_temperature,
+    }
+    for name, value in readings.items():
+        if value is not None:
+            hass.states.async_set(
+                f"sensor.test_{name}", str(value), EXTERNAL_SENSOR_ATTRIBUTES[name]
+            )
+    await hass.async_block_till_done()
 
 
 def assert_entity_state(
@@ -136,22 +143,33 @@ def assert_entity_attribute(
     )
 
 
-async def update_plant_sensors(hass: HomeAssistant, entry_id: str) -> None:
+async def update_plant_sensors(plant: PlantDevice) -> None:
     """Update all plant sensors to read from external sensors.
 
     This triggers the internal plant sensors to read current values
     from their configured external sensors, and then updates the plant state.
+    The loop is drained before the plant update, so callers that just wrote
+    states do not need their own async_block_till_done.
     """
-    plant_data = hass.data[DOMAIN][entry_id]
-    plant = plant_data[ATTR_PLANT]
-
     # Update all plant sensors to read external sensor values
-    if ATTR_SENSORS in plant_data:
-        for sensor in plant_data[ATTR_SENSORS]:
-            await sensor.async_update()
-            sensor.async_write_ha_state()
+    for sensor in plant.meter_entities:
+        await sensor.async_update()
+        sensor.async_write_ha_state()
 
-    await hass.async_block_till_done()
+    await plant.hass.async_block_till_done()
 
     # Update the plant state calculation
     plant.update()
+
+
+async def apply_and_update(plant: PlantDevice, **readings: float) -> None:
+    """Set external sensor readings and recompute the plant state.
+
+    The states are written back to back without draining the loop in
+    between, update_plant_sensors reads them straight from the state machine.
+    """
+    for name, value in readings.items():
+        plant.hass.states.async_set(
+            f"sensor.test_{name}", str(value), EXTERNAL_SENSOR_ATTRIBUTES[name]
+        )
+    await update_plant_sensors(plant)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator, Generator
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -20,6 +21,7 @@ from pytest_homeassistant_custom_component.common import (
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+from custom_components.plant import PlantDevice
 from custom_components.plant.const import (
     ATTR_LIMITS,
     ATTR_SPECIES,
@@ -39,6 +41,7 @@ from custom_components.plant.const import (
     CONF_MIN_MOISTURE,
     CONF_MIN_SOIL_TEMPERATURE,
     CONF_MIN_TEMPERATURE,
+    DATA_PLANTS,
     DATA_SOURCE,
     DATA_SOURCE_DEFAULT,
     DATA_SOURCE_PLANTBOOK,
@@ -55,6 +58,7 @@ from custom_components.plant.const import (
     OPB_DISPLAY_PID,
 )
 
+from .common import BASELINE_READINGS, apply_and_update
 from .fixtures.openplantbook_responses import (
     GET_RESULT_MONSTERA_DELICIOSA,
     GET_RESULT_WITH_DLI,
@@ -74,6 +78,26 @@ TEST_PLANT_SPECIES = "monstera deliciosa"
 TEST_PLANT_DISPLAY_SPECIES = "Monstera deliciosa"
 TEST_PLANT_IMAGE = "https://example.com/plant.jpg"
 TEST_ENTRY_ID = "test_entry_id_12345"
+TEST_PLANT_LIMITS = MappingProxyType(
+    {
+        CONF_MAX_MOISTURE: 60,
+        CONF_MIN_MOISTURE: 20,
+        CONF_MAX_TEMPERATURE: 40,
+        CONF_MIN_TEMPERATURE: 10,
+        CONF_MAX_CONDUCTIVITY: 3000,
+        CONF_MIN_CONDUCTIVITY: 500,
+        CONF_MAX_ILLUMINANCE: 100000,
+        CONF_MIN_ILLUMINANCE: 0,
+        CONF_MAX_HUMIDITY: 60,
+        CONF_MIN_HUMIDITY: 20,
+        CONF_MAX_DLI: 30,
+        CONF_MIN_DLI: 2,
+        CONF_MAX_CO2: 2000,
+        CONF_MIN_CO2: 400,
+        CONF_MAX_SOIL_TEMPERATURE: 40,
+        CONF_MIN_SOIL_TEMPERATURE: 10,
+    }
+)
 
 
 def create_plant_config_data(
@@ -93,24 +117,8 @@ def create_plant_config_data(
 ) -> dict[str, Any]:
     """Create plant configuration data for testing."""
     if limits is None:
-        limits = {
-            CONF_MAX_MOISTURE: 60,
-            CONF_MIN_MOISTURE: 20,
-            CONF_MAX_TEMPERATURE: 40,
-            CONF_MIN_TEMPERATURE: 10,
-            CONF_MAX_CONDUCTIVITY: 3000,
-            CONF_MIN_CONDUCTIVITY: 500,
-            CONF_MAX_ILLUMINANCE: 100000,
-            CONF_MIN_ILLUMINANCE: 0,
-            CONF_MAX_HUMIDITY: 60,
-            CONF_MIN_HUMIDITY: 20,
-            CONF_MAX_DLI: 30,
-            CONF_MIN_DLI: 2,
-            CONF_MAX_CO2: 2000,
-            CONF_MIN_CO2: 400,
-            CONF_MAX_SOIL_TEMPERATURE: 40,
-            CONF_MIN_SOIL_TEMPERATURE: 10,
-        }
+        # Entries keep their own copy, the shared defaults stay read-only
+        limits = dict(TEST_PLANT_LIMITS)
 
     return {
         DATA_SOURCE: data_source,
@@ -157,8 +165,7 @@ def plant_config_data_with_opb() -> dict[str, Any]:
     return create_plant_config_data(
         data_source=DATA_SOURCE_PLANTBOOK,
         limits={
-            CONF_MAX_MOISTURE: 60,
-            CONF_MIN_MOISTURE: 20,
+            **TEST_PLANT_LIMITS,
             CONF_MAX_TEMPERATURE: 30,
             CONF_MIN_TEMPERATURE: 15,
             CONF_MAX_CONDUCTIVITY: 2000,
@@ -169,8 +176,6 @@ def plant_config_data_with_opb() -> dict[str, Any]:
             CONF_MIN_HUMIDITY: 50,
             CONF_MAX_DLI: 22,  # Calculated from max_light_mmol
             CONF_MIN_DLI: 5,  # Calculated from min_light_mmol
-            CONF_MAX_CO2: 2000,
-            CONF_MIN_CO2: 400,
             CONF_MAX_SOIL_TEMPERATURE: 30,
             CONF_MIN_SOIL_TEMPERATURE: 15,
         },
@@ -404,6 +409,19 @@ async def init_integration(
         await hass.async_block_till_done()
 
 
+@pytest.fixture
+def plant(hass: HomeAssistant, init_integration: MockConfigEntry) -> PlantDevice:
+    """Return the PlantDevice set up by init_integration."""
+    return hass.data[DOMAIN][DATA_PLANTS][init_integration.entry_id]
+
+
+@pytest.fixture
+async def healthy_plant(plant: PlantDevice) -> PlantDevice:
+    """Return the plant with every meter reading inside its default limits."""
+    await apply_and_update(plant, **BASELINE_READINGS)
+    return plant
+
+
 @pytest.fixture
 async def init_integration_no_sensors(
     hass: HomeAssistant,
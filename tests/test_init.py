@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from homeassistant.config_entries import SOURCE_IMPORT
 from homeassistant.const import (
     STATE_OK,
@@ -16,17 +19,79 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.plant import async_setup
+from custom_components.plant import PlantDevice, async_setup
 from custom_components.plant.const import (
     ATTR_PLANT,
+    ATTR_SENSORS,
+    ATTR_THRESHOLDS,
+    DATA_PLANTS,
     DOMAIN,
-    FLOW_PLANT_INFO,
+    FLOW_CO2_TRIGGER,
+    FLOW_CONDUCTIVITY_TRIGGER,
+    FLOW_HUMIDITY_TRIGGER,
+    FLOW_MOISTURE_TRIGGER,
+    FLOW_SOIL_TEMPERATURE_TRIGGER,
     STATE_HIGH,
     STATE_LOW,
 )
 
-from .common import set_external_sensor_states, update_plant_sensors
-from .conftest import TEST_PLANT_NAME
+from .common import (
+    BASELINE_READINGS,
+    apply_and_update,
+    set_external_sensor_states,
+    setup_and_wait,
+    update_plant_sensors,
+)
+from .conftest import TEST_PLANT_LIMITS, TEST_PLANT_NAME, create_plant_config_data
+
+EXPECTED_ATTRS = frozenset(
+    {
+        "species",
+        "moisture_status",
+        "temperature_status",
+        "conductivity_status",
+        "illuminance_status",
+        "humidity_status",
+        "dli_status",
+        "co2_status",
+        "soil_temperature_status",
+    }
+)
+EXPECTED_WS_METERS = frozenset(
+    {
+        "temperature",
+        "illuminance",
+        "moisture",
+        "conductivity",
+        "humidity",
+        "dli",
+        "co2",
+        "soil_temperature",
+    }
+)
+EXPECTED_WS_FIELDS = frozenset({"max", "min", "current"})
+
+
+def _set_dli_reading(
+    monkeypatch: pytest.MonkeyPatch, plant: PlantDevice, last_period: float | str
+) -> None:
+    """Make the plant's DLI sensor report last_period until the test ends."""
+    monkeypatch.setattr(plant.dli, "_attr_native_value", last_period)
+    monkeypatch.setattr(plant.dli, "_last_period", last_period)
+
+
+def _make_entry(
+    entry_id: str, *, options: dict[str, Any] | None = None, **config: Any
+) -> MockConfigEntry:
+    """Build a plant config entry, with config overrides for create_plant_config_data."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        entry_id=entry_id,
+        unique_id=entry_id,
+        title=config.get("name", TEST_PLANT_NAME),
+        data=create_plant_config_data(**config),
+        options=options or {},
+    )
 
 
 class TestIntegrationSetup:
@@ -41,6 +106,10 @@ class TestIntegrationSetup:
         assert DOMAIN in hass.data
         assert init_integration.entry_id in hass.data[DOMAIN]
         assert ATTR_PLANT in hass.data[DOMAIN][init_integration.entry_id]
+        assert (
+            hass.data[DOMAIN][DATA_PLANTS][init_integration.entry_id]
+            is hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
+        )
 
     async def test_setup_entry_creates_device(
         self,
@@ -61,14 +130,13 @@ class TestIntegrationSetup:
         init_integration: MockConfigEntry,
     ) -> None:
         """Test that setup creates expected entities."""
-        entity_registry = er.async_get(hass)
-        entities = er.async_entries_for_config_entry(
-            entity_registry, init_integration.entry_id
-        )
+        entry_data = hass.data[DOMAIN][init_integration.entry_id]
+        entities = [*entry_data[ATTR_SENSORS], *entry_data[ATTR_THRESHOLDS]]
 
-        # Should have: 7 sensors + 17 thresholds + 3 calculated sensors = 27
-        # Plus potentially the main plant entity
-        assert len(entities) >= 24  # At minimum sensors + thresholds
+        # 7 sensors + 17 thresholds, each registered with the entity registry
+        assert len(entities) == 24
+        unregistered = [e.entity_id for e in entities if e.registry_entry is None]
+        assert not unregistered, f"not registered: {unregistered}"
 
     async def test_unload_entry(
         self,
@@ -84,6 +152,9 @@ class TestIntegrationSetup:
 
         # Entry should be removed from domain data
         assert init_integration.entry_id not in hass.data.get(DOMAIN, {})
+        assert init_integration.entry_id not in hass.data.get(DOMAIN, {}).get(
+            DATA_PLANTS, {}
+        )
 
     async def test_remove_entry(
         self,
@@ -137,21 +208,11 @@ class TestIntegrationSetup:
         The function should retry with registry lookup and give up gracefully
         instead of blocking the entire setup with ConfigEntryNotReady.
         """
-        from tests.conftest import create_plant_config_data
-
-        config_data = create_plant_config_data()
-        entry = MockConfigEntry(
-            domain=DOMAIN,
-            data=config_data,
-            entry_id="test_registry_delayed",
-        )
+        entry = _make_entry("test_registry_delayed")
         entry.add_to_hass(hass)
 
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
         # Setup should complete successfully (not stuck in SETUP_RETRY)
-        assert entry.state.name == "LOADED"
+        await setup_and_wait(hass, entry)
 
     async def test_setup_entry_no_plant_info(
         self,
@@ -176,132 +237,39 @@ class TestIntegrationSetup:
 class TestPlantDevice:
     """Tests for PlantDevice entity."""
 
-    async def test_plant_device_state_ok(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device state is OK when all readings are within thresholds."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Set values within thresholds
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,  # Within 10-40
-            moisture=40.0,  # Within 20-60
-            conductivity=1000.0,  # Within 500-3000
-            illuminance=5000.0,  # Within 0-100000
-            humidity=40.0,  # Within 20-60
-        )
-
-        # Update internal sensors and plant state
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_OK
-
-    async def test_plant_device_state_problem_moisture_low(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when moisture is too low."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=5.0,  # Below min of 20
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.moisture_status == STATE_LOW
-
-    async def test_plant_device_state_problem_moisture_high(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when moisture is too high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=80.0,  # Above max of 60
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.moisture_status == STATE_HIGH
-
-    async def test_plant_device_state_problem_temperature_low(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when temperature is too low."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=5.0,  # Below min of 10
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.temperature_status == STATE_LOW
-
-    async def test_plant_device_state_problem_temperature_high(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when temperature is too high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=45.0,  # Above max of 40
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.temperature_status == STATE_HIGH
-
-    async def test_plant_device_state_problem_illuminance_high(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when illuminance is too high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=150000.0,  # Above max of 100000
-            humidity=40.0,
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.illuminance_status == STATE_HIGH
+    @pytest.mark.parametrize(
+        ("sensor", "value", "expected_status"),
+        [
+            pytest.param("moisture", 40.0, STATE_OK, id="ok"),
+            pytest.param("moisture", 5.0, STATE_LOW, id="moisture_low"),
+            pytest.param("moisture", 80.0, STATE_HIGH, id="moisture_high"),
+            pytest.param("temperature", 5.0, STATE_LOW, id="temperature_low"),
+            pytest.param("temperature", 45.0, STATE_HIGH, id="temperature_high"),
+            pytest.param("illuminance", 150000.0, STATE_HIGH, id="illuminance_high"),
+            pytest.param("conductivity", 100.0, STATE_LOW, id="conductivity_low"),
+            pytest.param("conductivity", 5000.0, STATE_HIGH, id="conductivity_high"),
+            pytest.param("humidity", 10.0, STATE_LOW, id="humidity_low"),
+            pytest.param("humidity", 80.0, STATE_HIGH, id="humidity_high"),
+            pytest.param("co2", 200.0, STATE_LOW, id="co2_low"),
+            pytest.param("co2", 3000.0, STATE_HIGH, id="co2_high"),
+            pytest.param("soil_temperature", 5.0, STATE_LOW, id="soil_temperature_low"),
+            pytest.param(
+                "soil_temperature", 50.0, STATE_HIGH, id="soil_temperature_high"
+            ),
+        ],
+    )
+    async def test_plant_device_threshold_crossing(
+        self,
+        plant: PlantDevice,
+        sensor: str,
+        value: float,
+        expected_status: str,
+    ) -> None:
+        """Test plant state and sensor status when one reading leaves its range."""
+        await apply_and_update(plant, **{**BASELINE_READINGS, sensor: value})
+        assert getattr(plant, f"{sensor}_status") == expected_status
+        expected_state = STATE_OK if expected_status == STATE_OK else STATE_PROBLEM
+        assert plant.state == expected_state
 
     async def test_plant_device_state_unknown_no_sensors(
         self,
@@ -316,52 +284,40 @@ class TestPlantDevice:
     async def test_plant_device_extra_state_attributes(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test plant device extra state attributes."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         plant.plant_complete = True
 
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-            co2=800.0,
-            soil_temperature=22.0,
-        )
-        await hass.async_block_till_done()
+        await set_external_sensor_states(hass, **BASELINE_READINGS)
         plant.update()
 
-        attrs = plant.extra_state_attributes
-        assert "species" in attrs
-        assert "moisture_status" in attrs
-        assert "temperature_status" in attrs
-        assert "conductivity_status" in attrs
-        assert "illuminance_status" in attrs
-        assert "humidity_status" in attrs
-        assert "dli_status" in attrs
-        assert "co2_status" in attrs
-        assert "soil_temperature_status" in attrs
+        missing = EXPECTED_ATTRS - plant.extra_state_attributes.keys()
+        assert not missing, f"missing attrs: {missing}"
+
+    async def test_plant_device_extra_state_attributes_follow_update(
+        self,
+        plant: PlantDevice,
+    ) -> None:
+        """Test cached attributes are rebuilt after the statuses change."""
+        plant.plant_complete = True
+
+        await apply_and_update(plant, moisture=40.0)
+        assert plant.extra_state_attributes["moisture_status"] == STATE_OK
+
+        await apply_and_update(plant, moisture=5.0)
+        assert plant.extra_state_attributes["moisture_status"] == STATE_LOW
 
     async def test_plant_device_species_capitalization(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test plant species is capitalized correctly (binomial nomenclature).
 
         The genus (first word) should be capitalized, rest should be preserved.
         E.g., "monstera deliciosa" -> "Monstera deliciosa"
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-        plant.plant_complete = True
-        plant.update()
-
-        attrs = plant.extra_state_attributes
-        species = attrs["species"]
+        species = plant.extra_state_attributes["species"]
 
         # First letter should be uppercase
         assert species[0].isupper(), f"First letter should be uppercase: {species}"
@@ -373,139 +329,75 @@ class TestPlantDevice:
         hass: HomeAssistant,
     ) -> None:
         """Test species capitalization when input is all lowercase."""
-        from tests.conftest import create_plant_config_data
-
         # Create config with all lowercase display_species
-        config_data = create_plant_config_data(
-            display_species="solanum lycopersicum",
-        )
-
-        entry = MockConfigEntry(
-            domain=DOMAIN,
-            data=config_data,
-            entry_id="test_lowercase_species",
+        entry = _make_entry(
+            "test_lowercase_species", display_species="solanum lycopersicum"
         )
         entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
+        await setup_and_wait(hass, entry)
 
         plant = hass.data[DOMAIN][entry.entry_id][ATTR_PLANT]
-        plant.plant_complete = True
-        plant.update()
-
-        attrs = plant.extra_state_attributes
-        species = attrs["species"]
+        species = plant.extra_state_attributes["species"]
 
         # First letter should be uppercase, rest preserved
         assert species == "Solanum lycopersicum"
 
     async def test_plant_device_device_info(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test plant device info."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         device_info = plant.device_info
         assert "identifiers" in device_info
         assert "name" in device_info
         assert device_info["name"] == TEST_PLANT_NAME
 
+    @pytest.mark.parametrize(
+        ("trigger", "sensor", "value"),
+        [
+            pytest.param(FLOW_MOISTURE_TRIGGER, "moisture", 5.0, id="moisture"),
+            pytest.param(
+                FLOW_CONDUCTIVITY_TRIGGER, "conductivity", 100.0, id="conductivity"
+            ),
+            pytest.param(FLOW_HUMIDITY_TRIGGER, "humidity", 10.0, id="humidity"),
+            pytest.param(FLOW_CO2_TRIGGER, "co2", 200.0, id="co2"),
+            pytest.param(
+                FLOW_SOIL_TEMPERATURE_TRIGGER,
+                "soil_temperature",
+                5.0,
+                id="soil_temperature",
+            ),
+        ],
+    )
     async def test_plant_device_trigger_disabled(
         self,
         hass: HomeAssistant,
         mock_external_sensors: None,
+        trigger: str,
+        sensor: str,
+        value: float,
     ) -> None:
-        """Test that disabling triggers prevents problem state."""
-        from homeassistant.const import ATTR_ENTITY_PICTURE, ATTR_NAME
-
-        from custom_components.plant.const import (
-            CONF_MAX_CONDUCTIVITY,
-            CONF_MAX_DLI,
-            CONF_MAX_HUMIDITY,
-            CONF_MAX_ILLUMINANCE,
-            CONF_MAX_MOISTURE,
-            CONF_MAX_TEMPERATURE,
-            CONF_MIN_CONDUCTIVITY,
-            CONF_MIN_DLI,
-            CONF_MIN_HUMIDITY,
-            CONF_MIN_ILLUMINANCE,
-            CONF_MIN_MOISTURE,
-            CONF_MIN_TEMPERATURE,
-            DATA_SOURCE,
-            FLOW_MOISTURE_TRIGGER,
-            OPB_DISPLAY_PID,
-        )
-
-        # Create config entry with moisture trigger disabled
-        entry = MockConfigEntry(
-            domain=DOMAIN,
-            entry_id="test_entry_trigger_disabled",
-            unique_id="test_entry_trigger_disabled",
-            title="Test Plant",
-            data={
-                DATA_SOURCE: "Default values",
-                FLOW_PLANT_INFO: {
-                    ATTR_NAME: "Test Plant",
-                    "species": "monstera deliciosa",
-                    OPB_DISPLAY_PID: "Monstera deliciosa",
-                    ATTR_ENTITY_PICTURE: "https://example.com/plant.jpg",
-                    "limits": {
-                        CONF_MAX_MOISTURE: 60,
-                        CONF_MIN_MOISTURE: 20,
-                        CONF_MAX_TEMPERATURE: 40,
-                        CONF_MIN_TEMPERATURE: 10,
-                        CONF_MAX_CONDUCTIVITY: 3000,
-                        CONF_MIN_CONDUCTIVITY: 500,
-                        CONF_MAX_ILLUMINANCE: 100000,
-                        CONF_MIN_ILLUMINANCE: 0,
-                        CONF_MAX_HUMIDITY: 60,
-                        CONF_MIN_HUMIDITY: 20,
-                        CONF_MAX_DLI: 30,
-                        CONF_MIN_DLI: 2,
-                    },
-                    "temperature_sensor": "sensor.test_temperature",
-                    "moisture_sensor": "sensor.test_moisture",
-                    "conductivity_sensor": "sensor.test_conductivity",
-                    "illuminance_sensor": "sensor.test_illuminance",
-                    "humidity_sensor": "sensor.test_humidity",
-                },
-            },
-            options={FLOW_MOISTURE_TRIGGER: False},
-        )
+        """Test that disabling a trigger keeps its low status out of the plant state."""
+        entry = _make_entry("test_entry_trigger_disabled", options={trigger: False})
         entry.add_to_hass(hass)
 
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
+        await setup_and_wait(hass, entry)
 
         plant = hass.data[DOMAIN][entry.entry_id][ATTR_PLANT]
 
-        # Set all sensors - moisture below threshold, others normal
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=5.0,  # Below threshold
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-
-        await update_plant_sensors(hass, entry.entry_id)
+        # Set all sensors - one below threshold, others normal
+        await apply_and_update(plant, **{**BASELINE_READINGS, sensor: value})
 
-        # moisture_status should still be LOW
-        assert plant.moisture_status == STATE_LOW
+        # The sensor status should still be LOW
+        assert getattr(plant, f"{sensor}_status") == STATE_LOW
         # But overall state should be OK because trigger is disabled
         assert plant.state == STATE_OK
 
     async def test_plant_device_add_image(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test adding an image to the plant device."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         new_image = "https://example.com/new_plant.jpg"
         plant.add_image(new_image)
 
@@ -513,12 +405,10 @@ class TestPlantDevice:
 
     async def test_plant_device_add_media_source_image(
         self,
-        hass: HomeAssistant,
         init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test adding a media-source image passes through as-is."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         media_source_url = "media-source://media_source/local/plants/test.jpg"
         plant.add_image(media_source_url)
 
@@ -530,12 +420,9 @@ class TestPlantDevice:
 
     async def test_plant_device_websocket_info(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test websocket info property."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Before complete, should return empty dict
         plant.plant_complete = False
         assert plant.websocket_info == {}
@@ -544,701 +431,93 @@ class TestPlantDevice:
         plant.plant_complete = True
         ws_info = plant.websocket_info
 
-        assert "temperature" in ws_info
-        assert "illuminance" in ws_info
-        assert "moisture" in ws_info
-        assert "conductivity" in ws_info
-        assert "humidity" in ws_info
-        assert "dli" in ws_info
-        assert "co2" in ws_info
-        assert "soil_temperature" in ws_info
+        missing = EXPECTED_WS_METERS - ws_info.keys()
+        assert not missing, f"missing meters: {missing}"
 
         # Each should have max, min, current, icon, etc.
-        assert "max" in ws_info["temperature"]
-        assert "min" in ws_info["temperature"]
-        assert "current" in ws_info["temperature"]
+        missing = EXPECTED_WS_FIELDS - ws_info["temperature"].keys()
+        assert not missing, f"missing fields: {missing}"
 
-    async def test_plant_device_state_problem_conductivity_low(
+    @pytest.mark.parametrize(
+        ("last_period", "expected_status", "expected_state"),
+        [
+            pytest.param(1.0, STATE_LOW, STATE_PROBLEM, id="low"),  # min_dli is 2
+            pytest.param(40.0, STATE_HIGH, STATE_PROBLEM, id="high"),  # max_dli is 30
+            pytest.param(15.0, STATE_OK, STATE_OK, id="ok"),
+        ],
+    )
+    async def test_plant_device_dli_status(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        healthy_plant: PlantDevice,
+        monkeypatch: pytest.MonkeyPatch,
+        last_period: float,
+        expected_status: str,
+        expected_state: str,
     ) -> None:
-        """Test plant device shows problem when conductivity is too low."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=100.0,  # Below min of 500
-            illuminance=5000.0,
-            humidity=40.0,
-        )
+        """Test plant device DLI status follows the last period's DLI."""
+        _set_dli_reading(monkeypatch, healthy_plant, last_period)
+        healthy_plant.update()
 
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.conductivity_status == STATE_LOW
+        assert healthy_plant.dli_status == expected_status
+        assert healthy_plant.state == expected_state
 
-    async def test_plant_device_state_problem_conductivity_high(
+    async def test_plant_update_skips_unchanged_inputs(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        healthy_plant: PlantDevice,
     ) -> None:
-        """Test plant device shows problem when conductivity is too high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=5000.0,  # Above max of 3000
-            illuminance=5000.0,
-            humidity=40.0,
-        )
+        """Test update() does not recompute when nothing it reads has changed."""
+        with patch.object(healthy_plant, "update_registry") as mock_registry:
+            healthy_plant.update()
+            assert not mock_registry.called
 
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.conductivity_status == STATE_HIGH
+            await apply_and_update(healthy_plant, moisture=5.0)  # Below min of 20
+            assert mock_registry.call_count == 1
+            assert healthy_plant.moisture_status == STATE_LOW
+            assert healthy_plant.state == STATE_PROBLEM
 
-    async def test_plant_device_state_problem_humidity_low(
+    async def test_plant_update_recomputes_on_changed_inputs(
         self,
         hass: HomeAssistant,
         init_integration: MockConfigEntry,
+        healthy_plant: PlantDevice,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Test plant device shows problem when humidity is too low."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=10.0,  # Below min of 20
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.humidity_status == STATE_LOW
-
-    async def test_plant_device_state_problem_humidity_high(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when humidity is too high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=80.0,  # Above max of 60
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.humidity_status == STATE_HIGH
-
-    async def test_plant_device_state_problem_co2_low(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when CO2 is too low."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-            co2=200.0,  # Below min of 400
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.co2_status == STATE_LOW
-
-    async def test_plant_device_state_problem_co2_high(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when CO2 is too high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-            co2=3000.0,  # Above max of 2000
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.co2_status == STATE_HIGH
-
-    async def test_plant_device_state_problem_soil_temperature_low(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when soil temperature is too low."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-            soil_temperature=5.0,  # Below min of 10
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.soil_temperature_status == STATE_LOW
-
-    async def test_plant_device_state_problem_soil_temperature_high(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when soil temperature is too high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-            soil_temperature=50.0,  # Above max of 40
-        )
-
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_PROBLEM
-        assert plant.soil_temperature_status == STATE_HIGH
-
-    async def test_plant_device_conductivity_trigger_disabled(
-        self,
-        hass: HomeAssistant,
-        mock_external_sensors: None,
-    ) -> None:
-        """Test that disabling conductivity trigger prevents problem state."""
-        from homeassistant.const import ATTR_ENTITY_PICTURE, ATTR_NAME
-
-        from custom_components.plant.const import (
-            CONF_MAX_CONDUCTIVITY,
-            CONF_MAX_DLI,
-            CONF_MAX_HUMIDITY,
-            CONF_MAX_ILLUMINANCE,
-            CONF_MAX_MOISTURE,
-            CONF_MAX_TEMPERATURE,
-            CONF_MIN_CONDUCTIVITY,
-            CONF_MIN_DLI,
-            CONF_MIN_HUMIDITY,
-            CONF_MIN_ILLUMINANCE,
-            CONF_MIN_MOISTURE,
-            CONF_MIN_TEMPERATURE,
-            DATA_SOURCE,
-            FLOW_CONDUCTIVITY_TRIGGER,
-            OPB_DISPLAY_PID,
-        )
-
-        entry = MockConfigEntry(
-            domain=DOMAIN,
-            entry_id="test_entry_cond_trigger_disabled",
-            unique_id="test_entry_cond_trigger_disabled",
-            title="Test Plant",
-            data={
-                DATA_SOURCE: "Default values",
-                FLOW_PLANT_INFO: {
-                    ATTR_NAME: "Test Plant",
-                    "species": "monstera deliciosa",
-                    OPB_DISPLAY_PID: "Monstera deliciosa",
-                    ATTR_ENTITY_PICTURE: "https://example.com/plant.jpg",
-                    "limits": {
-                        CONF_MAX_MOISTURE: 60,
-                        CONF_MIN_MOISTURE: 20,
-                        CONF_MAX_TEMPERATURE: 40,
-                        CONF_MIN_TEMPERATURE: 10,
-                        CONF_MAX_CONDUCTIVITY: 3000,
-                        CONF_MIN_CONDUCTIVITY: 500,
-                        CONF_MAX_ILLUMINANCE: 100000,
-                        CONF_MIN_ILLUMINANCE: 0,
-                        CONF_MAX_HUMIDITY: 60,
-                        CONF_MIN_HUMIDITY: 20,
-                        CONF_MAX_DLI: 30,
-                        CONF_MIN_DLI: 2,
-                    },
-                    "temperature_sensor": "sensor.test_temperature",
-                    "moisture_sensor": "sensor.test_moisture",
-                    "conductivity_sensor": "sensor.test_conductivity",
-                    "illuminance_sensor": "sensor.test_illuminance",
-                    "humidity_sensor": "sensor.test_humidity",
-                },
-            },
-            options={FLOW_CONDUCTIVITY_TRIGGER: False},
-        )
-        entry.add_to_hass(hass)
-
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        plant = hass.data[DOMAIN][entry.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=100.0,  # Below threshold
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-
-        await update_plant_sensors(hass, entry.entry_id)
-
-        assert plant.conductivity_status == STATE_LOW
-        assert plant.state == STATE_OK
-
-    async def test_plant_device_humidity_trigger_disabled(
-        self,
-        hass: HomeAssistant,
-        mock_external_sensors: None,
-    ) -> None:
-        """Test that disabling humidity trigger prevents problem state."""
-        from homeassistant.const import ATTR_ENTITY_PICTURE, ATTR_NAME
-
-        from custom_components.plant.const import (
-            CONF_MAX_CONDUCTIVITY,
-            CONF_MAX_DLI,
-            CONF_MAX_HUMIDITY,
-            CONF_MAX_ILLUMINANCE,
-            CONF_MAX_MOISTURE,
-            CONF_MAX_TEMPERATURE,
-            CONF_MIN_CONDUCTIVITY,
-            CONF_MIN_DLI,
-            CONF_MIN_HUMIDITY,
-            CONF_MIN_ILLUMINANCE,
-            CONF_MIN_MOISTURE,
-            CONF_MIN_TEMPERATURE,
-            DATA_SOURCE,
-            FLOW_HUMIDITY_TRIGGER,
-            OPB_DISPLAY_PID,
-        )
-
-        entry = MockConfigEntry(
-            domain=DOMAIN,
-            entry_id="test_entry_humidity_trigger_disabled",
-            unique_id="test_entry_humidity_trigger_disabled",
-            title="Test Plant",
-            data={
-                DATA_SOURCE: "Default values",
-                FLOW_PLANT_INFO: {
-                    ATTR_NAME: "Test Plant",
-                    "species": "monstera deliciosa",
-                    OPB_DISPLAY_PID: "Monstera deliciosa",
-                    ATTR_ENTITY_PICTURE: "https://example.com/plant.jpg",
-                    "limits": {
-                        CONF_MAX_MOISTURE: 60,
-                        CONF_MIN_MOISTURE: 20,
-                        CONF_MAX_TEMPERATURE: 40,
-                        CONF_MIN_TEMPERATURE: 10,
-                        CONF_MAX_CONDUCTIVITY: 3000,
-                        CONF_MIN_CONDUCTIVITY: 500,
-                        CONF_MAX_ILLUMINANCE: 100000,
-                        CONF_MIN_ILLUMINANCE: 0,
-                        CONF_MAX_HUMIDITY: 60,
-                        CONF_MIN_HUMIDITY: 20,
-                        CONF_MAX_DLI: 30,
-                        CONF_MIN_DLI: 2,
-                    },
-                    "temperature_sensor": "sensor.test_temperature",
-                    "moisture_sensor": "sensor.test_moisture",
-                    "conductivity_sensor": "sensor.test_conductivity",
-                    "illuminance_sensor": "sensor.test_illuminance",
-                    "humidity_sensor": "sensor.test_humidity",
-                },
-            },
-            options={FLOW_HUMIDITY_TRIGGER: False},
-        )
-        entry.add_to_hass(hass)
-
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
+        """Test threshold, trigger and DLI changes are not hidden by the skip."""
+        assert healthy_plant.moisture_status == STATE_OK
 
-        plant = hass.data[DOMAIN][entry.entry_id][ATTR_PLANT]
+        # Raising min_moisture above the baseline reading of 40 → LOW
+        await healthy_plant.min_moisture.async_set_native_value(45)
+        healthy_plant.update()
+        assert healthy_plant.moisture_status == STATE_LOW
+        assert healthy_plant.state == STATE_PROBLEM
 
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=10.0,  # Below threshold
+        # Disabling the moisture trigger keeps LOW out of the plant state
+        hass.config_entries.async_update_entry(
+            init_integration,
+            options={**init_integration.options, FLOW_MOISTURE_TRIGGER: False},
         )
-
-        await update_plant_sensors(hass, entry.entry_id)
-
-        assert plant.humidity_status == STATE_LOW
-        assert plant.state == STATE_OK
-
-    async def test_plant_device_co2_trigger_disabled(
-        self,
-        hass: HomeAssistant,
-        mock_external_sensors: None,
-    ) -> None:
-        """Test that disabling CO2 trigger prevents problem state."""
-        from homeassistant.const import ATTR_ENTITY_PICTURE, ATTR_NAME
-
-        from custom_components.plant.const import (
-            CONF_MAX_CO2,
-            CONF_MAX_CONDUCTIVITY,
-            CONF_MAX_DLI,
-            CONF_MAX_HUMIDITY,
-            CONF_MAX_ILLUMINANCE,
-            CONF_MAX_MOISTURE,
-            CONF_MAX_SOIL_TEMPERATURE,
-            CONF_MAX_TEMPERATURE,
-            CONF_MIN_CO2,
-            CONF_MIN_CONDUCTIVITY,
-            CONF_MIN_DLI,
-            CONF_MIN_HUMIDITY,
-            CONF_MIN_ILLUMINANCE,
-            CONF_MIN_MOISTURE,
-            CONF_MIN_SOIL_TEMPERATURE,
-            CONF_MIN_TEMPERATURE,
-            DATA_SOURCE,
-            FLOW_CO2_TRIGGER,
-            OPB_DISPLAY_PID,
-        )
-
-        entry = MockConfigEntry(
-            domain=DOMAIN,
-            entry_id="test_entry_co2_trigger_disabled",
-            unique_id="test_entry_co2_trigger_disabled",
-            title="Test Plant",
-            data={
-                DATA_SOURCE: "Default values",
-                FLOW_PLANT_INFO: {
-                    ATTR_NAME: "Test Plant",
-                    "species": "monstera deliciosa",
-                    OPB_DISPLAY_PID: "Monstera deliciosa",
-                    ATTR_ENTITY_PICTURE: "https://example.com/plant.jpg",
-                    "limits": {
-                        CONF_MAX_MOISTURE: 60,
-                        CONF_MIN_MOISTURE: 20,
-                        CONF_MAX_TEMPERATURE: 40,
-                        CONF_MIN_TEMPERATURE: 10,
-                        CONF_MAX_CONDUCTIVITY: 3000,
-                        CONF_MIN_CONDUCTIVITY: 500,
-                        CONF_MAX_ILLUMINANCE: 100000,
-                        CONF_MIN_ILLUMINANCE: 0,
-                        CONF_MAX_HUMIDITY: 60,
-                        CONF_MIN_HUMIDITY: 20,
-                        CONF_MAX_DLI: 30,
-                        CONF_MIN_DLI: 2,
-                        CONF_MAX_CO2: 2000,
-                        CONF_MIN_CO2: 400,
-                        CONF_MAX_SOIL_TEMPERATURE: 40,
-                        CONF_MIN_SOIL_TEMPERATURE: 10,
-                    },
-                    "temperature_sensor": "sensor.test_temperature",
-                    "moisture_sensor": "sensor.test_moisture",
-                    "conductivity_sensor": "sensor.test_conductivity",
-                    "illuminance_sensor": "sensor.test_illuminance",
-                    "humidity_sensor": "sensor.test_humidity",
-                    "co2_sensor": "sensor.test_co2",
-                    "soil_temperature_sensor": "sensor.test_soil_temperature",
-                },
-            },
-            options={FLOW_CO2_TRIGGER: False},
-        )
-        entry.add_to_hass(hass)
-
-        await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
+        healthy_plant.update()
+        assert healthy_plant.moisture_status == STATE_LOW
+        assert healthy_plant.state == STATE_OK
 
-        plant = hass.data[DOMAIN][entry.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-            co2=200.0,  # Below threshold
-        )
-
-        await update_plant_sensors(hass, entry.entry_id)
-
-        assert plant.co2_status == STATE_LOW
-        assert plant.state == STATE_OK
-
-    async def test_plant_device_soil_temperature_trigger_disabled(
-        self,
-        hass: HomeAssistant,
-        mock_external_sensors: None,
-    ) -> None:
-        """Test that disabling soil temperature trigger prevents problem state."""
-        from homeassistant.const import ATTR_ENTITY_PICTURE, ATTR_NAME
-
-        from custom_components.plant.const import (
-            CONF_MAX_CO2,
-            CONF_MAX_CONDUCTIVITY,
-            CONF_MAX_DLI,
-            CONF_MAX_HUMIDITY,
-            CONF_MAX_ILLUMINANCE,
-            CONF_MAX_MOISTURE,
-            CONF_MAX_SOIL_TEMPERATURE,
-            CONF_MAX_TEMPERATURE,
-            CONF_MIN_CO2,
-            CONF_MIN_CONDUCTIVITY,
-            CONF_MIN_DLI,
-            CONF_MIN_HUMIDITY,
-            CONF_MIN_ILLUMINANCE,
-            CONF_MIN_MOISTURE,
-            CONF_MIN_SOIL_TEMPERATURE,
-            CONF_MIN_TEMPERATURE,
-            DATA_SOURCE,
-            FLOW_SOIL_TEMPERATURE_TRIGGER,
-            OPB_DISPLAY_PID,
-        )
-
-        entry = MockConfigEntry(
-            domain=DOMAIN,
-            entry_id="test_entry_soil_temp_trigger_disabled",
-            unique_id="test_entry_soil_temp_trigger_disabled",
-            title="Test Plant",
-            data={
-                DATA_SOURCE: "Default values",
-                FLOW_PLANT_INFO: {
-                    ATTR_NAME: "Test Plant",
-                    "species": "monstera deliciosa",
-                    OPB_DISPLAY_PID: "Monstera deliciosa",
-                    ATTR_ENTITY_PICTURE: "https://example.com/plant.jpg",
-                    "limits": {
-                        CONF_MAX_MOISTURE: 60,
-                        CONF_MIN_MOISTURE: 20,
-                        CONF_MAX_TEMPERATURE: 40,
-                        CONF_MIN_TEMPERATURE: 10,
-                        CONF_MAX_CONDUCTIVITY: 3000,
-                        CONF_MIN_CONDUCTIVITY: 500,
-                        CONF_MAX_ILLUMINANCE: 100000,
-                        CONF_MIN_ILLUMINANCE: 0,
-                        CONF_MAX_HUMIDITY: 60,
-                        CONF_MIN_HUMIDITY: 20,
-                        CONF_MAX_DLI: 30,
-                        CONF_MIN_DLI: 2,
-                        CONF_MAX_CO2: 2000,
-                        CONF_MIN_CO2: 400,
-                        CONF_MAX_SOIL_TEMPERATURE: 40,
-                        CONF_MIN_SOIL_TEMPERATURE: 10,
-                    },
-                    "temperature_sensor": "sensor.test_temperature",
-                    "moisture_sensor": "sensor.test_moisture",
-                    "conductivity_sensor": "sensor.test_conductivity",
-                    "illuminance_sensor": "sensor.test_illuminance",
-                    "humidity_sensor": "sensor.test_humidity",
-                    "co2_sensor": "sensor.test_co2",
-                    "soil_temperature_sensor": "sensor.test_soil_temperature",
-                },
-            },
-            options={FLOW_SOIL_TEMPERATURE_TRIGGER: False},
-        )
-        entry.add_to_hass(hass)
-
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        plant = hass.data[DOMAIN][entry.entry_id][ATTR_PLANT]
-
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-            soil_temperature=5.0,  # Below threshold
-        )
-
-        await update_plant_sensors(hass, entry.entry_id)
-
-        assert plant.soil_temperature_status == STATE_LOW
-        assert plant.state == STATE_OK
-
-    async def test_plant_device_dli_status_low(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when DLI is too low."""
-        from unittest.mock import PropertyMock, patch
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Set all normal values first
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-
-        # Mock DLI sensor to have a low last_period value
-        # min_dli is 2, so set last_period to 1 (below threshold)
-        mock_attrs = {"last_period": 1.0}
-        with patch.object(
-            type(plant.dli),
-            "extra_state_attributes",
-            new_callable=PropertyMock,
-            return_value=mock_attrs,
-        ):
-            with patch.object(
-                type(plant.dli),
-                "native_value",
-                new_callable=PropertyMock,
-                return_value=1.0,
-            ):
-                with patch.object(
-                    type(plant.dli),
-                    "state",
-                    new_callable=PropertyMock,
-                    return_value="1.0",
-                ):
-                    plant.update()
-
-        assert plant.dli_status == STATE_LOW
-        assert plant.state == STATE_PROBLEM
-
-    async def test_plant_device_dli_status_high(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows problem when DLI is too high."""
-        from unittest.mock import PropertyMock, patch
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Set all normal values first
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-
-        # Mock DLI sensor to have a high last_period value
-        # max_dli is 30, so set last_period to 40 (above threshold)
-        mock_attrs = {"last_period": 40.0}
-        with patch.object(
-            type(plant.dli),
-            "extra_state_attributes",
-            new_callable=PropertyMock,
-            return_value=mock_attrs,
-        ):
-            with patch.object(
-                type(plant.dli),
-                "native_value",
-                new_callable=PropertyMock,
-                return_value=40.0,
-            ):
-                with patch.object(
-                    type(plant.dli),
-                    "state",
-                    new_callable=PropertyMock,
-                    return_value="40.0",
-                ):
-                    plant.update()
-
-        assert plant.dli_status == STATE_HIGH
-        assert plant.state == STATE_PROBLEM
-
-    async def test_plant_device_dli_status_ok(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test plant device shows OK when DLI is within thresholds."""
-        from unittest.mock import PropertyMock, patch
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Set all normal values first
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-
-        # Mock DLI sensor to have a normal last_period value
-        # min_dli is 2, max_dli is 30, so set last_period to 15 (within threshold)
-        mock_attrs = {"last_period": 15.0}
-        with patch.object(
-            type(plant.dli),
-            "extra_state_attributes",
-            new_callable=PropertyMock,
-            return_value=mock_attrs,
-        ):
-            with patch.object(
-                type(plant.dli),
-                "native_value",
-                new_callable=PropertyMock,
-                return_value=15.0,
-            ):
-                with patch.object(
-                    type(plant.dli),
-                    "state",
-                    new_callable=PropertyMock,
-                    return_value="15.0",
-                ):
-                    plant.update()
-
-        assert plant.dli_status == STATE_OK
-        assert plant.state == STATE_OK
+        # A last period above max_dli of 30 → HIGH
+        _set_dli_reading(monkeypatch, healthy_plant, 40.0)
+        healthy_plant.update()
+        assert healthy_plant.dli_status == STATE_HIGH
+        assert healthy_plant.state == STATE_PROBLEM
 
     async def test_plant_status_reset_when_sensor_unavailable(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that sensor status is reset when sensor becomes unavailable."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # First set moisture to trigger problem state
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=5.0,  # Below min of 20
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
+        await apply_and_update(
+            plant,
+            **{**BASELINE_READINGS, "moisture": 5.0},  # Below min of 20
         )
-        await update_plant_sensors(hass, init_integration.entry_id)
 
         # Verify problem state
         assert plant.moisture_status == STATE_LOW
@@ -1246,8 +525,7 @@ class TestPlantDevice:
 
         # Now set moisture sensor to unavailable
         hass.states.async_set("sensor.test_moisture", STATE_UNAVAILABLE)
-        await hass.async_block_till_done()
-        await update_plant_sensors(hass, init_integration.entry_id)
+        await update_plant_sensors(plant)
 
         # Moisture status should be reset
         assert plant.moisture_status is None
@@ -1256,22 +534,14 @@ class TestPlantDevice:
 
     async def test_plant_status_reset_when_external_sensor_removed(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that sensor status is reset when external sensor is removed."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # First set temperature to trigger problem state
-        await set_external_sensor_states(
-            hass,
-            temperature=50.0,  # Above max of 40
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
+        await apply_and_update(
+            plant,
+            **{**BASELINE_READINGS, "temperature": 50.0},  # Above max of 40
         )
-        await update_plant_sensors(hass, init_integration.entry_id)
 
         # Verify problem state
         assert plant.temperature_status == STATE_HIGH
@@ -1279,8 +549,7 @@ class TestPlantDevice:
 
         # Remove the external sensor from the plant sensor
         plant.sensor_temperature.replace_external_sensor(None)
-        await hass.async_block_till_done()
-        await update_plant_sensors(hass, init_integration.entry_id)
+        await update_plant_sensors(plant)
 
         # Temperature status should be reset
         assert plant.temperature_status is None
@@ -1289,244 +558,181 @@ class TestPlantDevice:
 
     async def test_plant_recovers_from_problem_when_dli_sensor_unavailable(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        healthy_plant: PlantDevice,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test plant recovers from problem state when DLI sensor becomes unavailable."""
-        from unittest.mock import PropertyMock, patch
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Set normal sensor values
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-
         # Mock DLI sensor to trigger problem
-        mock_attrs = {"last_period": 1.0}  # Below min_dli of 2
-        with patch.object(
-            type(plant.dli),
-            "extra_state_attributes",
-            new_callable=PropertyMock,
-            return_value=mock_attrs,
-        ):
-            with patch.object(
-                type(plant.dli),
-                "native_value",
-                new_callable=PropertyMock,
-                return_value=1.0,
-            ):
-                with patch.object(
-                    type(plant.dli),
-                    "state",
-                    new_callable=PropertyMock,
-                    return_value="1.0",
-                ):
-                    plant.update()
+        _set_dli_reading(monkeypatch, healthy_plant, 1.0)  # Below min_dli of 2
+        healthy_plant.update()
 
         # Verify problem state
-        assert plant.dli_status == STATE_LOW
-        assert plant.state == STATE_PROBLEM
+        assert healthy_plant.dli_status == STATE_LOW
+        assert healthy_plant.state == STATE_PROBLEM
 
         # Now make DLI unavailable
-        with patch.object(
-            type(plant.dli),
-            "native_value",
-            new_callable=PropertyMock,
-            return_value=STATE_UNAVAILABLE,
-        ):
-            plant.update()
+        _set_dli_reading(monkeypatch, healthy_plant, STATE_UNAVAILABLE)
+        healthy_plant.update()
 
         # DLI status should be reset
-        assert plant.dli_status is None
+        assert healthy_plant.dli_status is None
         # Plant should recover to OK
-        assert plant.state == STATE_OK
+        assert healthy_plant.state == STATE_OK
 
 
 class TestHysteresis:
     """Tests for hysteresis behavior on threshold checks."""
 
-    async def test_moisture_low_holds_within_hysteresis_band(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test that moisture LOW state holds when value is within hysteresis band.
-
-        Default moisture: min=20, max=60, range=40, band=2.0 (5% of 40).
-        Enters PROBLEM at <20, should stay PROBLEM until >22.
+    @pytest.mark.parametrize(
+        ("sensor", "current_status", "readings", "expected"),
+        [
+            # min=20, max=60, band=2.0: LOW clears above 22, HIGH below 58
+            pytest.param(
+                "moisture",
+                None,
+                (15.0, 20.5, 23.0),
+                (STATE_LOW, STATE_LOW, STATE_OK),
+                id="moisture_low",
+            ),
+            pytest.param(
+                "moisture",
+                None,
+                (65.0, 59.0, 57.0),
+                (STATE_HIGH, STATE_HIGH, STATE_OK),
+                id="moisture_high",
+            ),
+            pytest.param(
+                "moisture", None, (21.0,), (STATE_OK,), id="fresh_within_band"
+            ),
+            pytest.param(
+                "moisture", STATE_LOW, (21.0,), (STATE_LOW,), id="held_within_band"
+            ),
+            pytest.param(
+                "moisture", STATE_LOW, (23.0,), (STATE_OK,), id="cleared_beyond_band"
+            ),
+            pytest.param(
+                "moisture",
+                STATE_HIGH,
+                (59.0,),
+                (STATE_HIGH,),
+                id="held_high_within_band",
+            ),
+            pytest.param(
+                "moisture", None, (59.0,), (STATE_OK,), id="fresh_high_within_band"
+            ),
+            # min=10, max=40, band=1.5: LOW clears above 11.5
+            pytest.param(
+                "temperature",
+                None,
+                (8.0, 11.0, 12.0),
+                (STATE_LOW, STATE_LOW, STATE_OK),
+                id="temperature_low",
+            ),
+            # min=0, max=100000, band=5000: HIGH clears below 95000
+            pytest.param(
+                "illuminance",
+                None,
+                (110000.0, 96000.0, 94000.0),
+                (STATE_HIGH, STATE_HIGH, STATE_OK),
+                id="illuminance_high",
+            ),
+            # min=500, max=3000, band=125: LOW clears above 625
+            pytest.param(
+                "conductivity",
+                None,
+                (400.0, 600.0, 650.0),
+                (STATE_LOW, STATE_LOW, STATE_OK),
+                id="conductivity_low",
+            ),
+        ],
+    )
+    def test_check_threshold(
+        self,
+        sensor: str,
+        current_status: str | None,
+        readings: tuple[float, ...],
+        expected: tuple[str, ...],
+    ) -> None:
+        """Test the hysteresis band directly, without a running integration.
+
+        The band is 5% of the min-max range. Each reading is checked in turn,
+        starting from current_status and feeding every result into the next.
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Step 1: Drop below min → PROBLEM
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=15.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.moisture_status == STATE_LOW
-        assert plant.state == STATE_PROBLEM
-
-        # Step 2: Rise to just above min but within band (20.5 < 20 + 2 = 22)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=20.5,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.moisture_status == STATE_LOW  # Still held
-        assert plant.state == STATE_PROBLEM
-
-        # Step 3: Rise above band (23 > 22) → clears to OK
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=23.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.moisture_status == STATE_OK
-        assert plant.state == STATE_OK
-
-    async def test_moisture_high_holds_within_hysteresis_band(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test that moisture HIGH state holds when value is within hysteresis band.
-
-        Default moisture: min=20, max=60, range=40, band=2.0.
-        Enters PROBLEM at >60, should stay PROBLEM until <58.
+        min_entity = SimpleNamespace(
+            entity_id=f"number.min_{sensor}",
+            state=str(TEST_PLANT_LIMITS[f"min_{sensor}"]),
+        )
+        max_entity = SimpleNamespace(
+            entity_id=f"number.max_{sensor}",
+            state=str(TEST_PLANT_LIMITS[f"max_{sensor}"]),
+        )
+
+        status = current_status
+        walk = []
+        for value in readings:
+            status = PlantDevice._check_threshold(value, min_entity, max_entity, status)
+            walk.append(status)
+
+        assert tuple(walk) == expected
+
+    @pytest.mark.parametrize(
+        ("sensor", "readings", "held_status"),
+        [
+            # min=20, max=60, band=2.0: LOW clears above 22
+            pytest.param("moisture", (15.0, 20.5, 23.0), STATE_LOW, id="moisture"),
+            # Illuminance has its own branch in update()
+            # min=0, max=100000, band=5000: HIGH clears below 95000
+            pytest.param(
+                "illuminance",
+                (110000.0, 96000.0, 94000.0),
+                STATE_HIGH,
+                id="illuminance",
+            ),
+        ],
+    )
+    async def test_status_holds_within_hysteresis_band(
+        self,
+        plant: PlantDevice,
+        sensor: str,
+        readings: tuple[float, float, float],
+        held_status: str,
+    ) -> None:
+        """Test update() carries the held status and plant state across the band.
+
+        readings are a value past the threshold, one back inside the range but
+        within the band, and one beyond the band.
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Step 1: Rise above max → PROBLEM
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=65.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.moisture_status == STATE_HIGH
+        outside, within_band, beyond_band = readings
+
+        # Step 1: Cross the threshold → PROBLEM
+        await apply_and_update(plant, **{**BASELINE_READINGS, sensor: outside})
+        assert getattr(plant, f"{sensor}_status") == held_status
         assert plant.state == STATE_PROBLEM
 
-        # Step 2: Drop to just below max but within band (59.0 >= 60 - 2 = 58)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=59.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.moisture_status == STATE_HIGH  # Still held
+        # Step 2: Back inside the range but within the band → still held
+        await apply_and_update(plant, **{sensor: within_band})
+        assert getattr(plant, f"{sensor}_status") == held_status
         assert plant.state == STATE_PROBLEM
 
-        # Step 3: Drop below band (57.0 < 58) → clears to OK
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=57.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.moisture_status == STATE_OK
+        # Step 3: Beyond the band → clears to OK
+        await apply_and_update(plant, **{sensor: beyond_band})
+        assert getattr(plant, f"{sensor}_status") == STATE_OK
         assert plant.state == STATE_OK
 
-    async def test_temperature_low_holds_within_hysteresis_band(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test temperature LOW hysteresis.
-
-        Default temperature: min=10, max=40, range=30, band=1.5.
-        Enters at <10, clears at >11.5.
-        """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Drop below min
-        await set_external_sensor_states(
-            hass,
-            temperature=8.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.temperature_status == STATE_LOW
-
-        # Rise within band (11.0 <= 10 + 1.5 = 11.5)
-        await set_external_sensor_states(
-            hass,
-            temperature=11.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.temperature_status == STATE_LOW  # held
-
-        # Rise above band (12.0 > 11.5)
-        await set_external_sensor_states(
-            hass,
-            temperature=12.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.temperature_status == STATE_OK
-
     async def test_no_hysteresis_on_fresh_state(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that hysteresis does not apply when state is fresh (None).
 
         A value within the hysteresis band but above the min threshold
         should be OK on first check, not held as LOW.
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Ensure fresh state (moisture_status is None before any reading)
         assert plant.moisture_status is None
 
         # Set moisture within hysteresis band (21 is > min=20 but < min+band=22)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=21.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
+        await apply_and_update(plant, **{**BASELINE_READINGS, "moisture": 21.0})
 
         # Should be OK, not LOW — no previous LOW state to hold
         assert plant.moisture_status == STATE_OK
@@ -1535,272 +741,91 @@ class TestHysteresis:
     async def test_hysteresis_resets_on_sensor_unavailable(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that hysteresis state resets when sensor becomes unavailable.
 
         After reset, returning within band should be OK (fresh state).
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Enter PROBLEM
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=15.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
+        await apply_and_update(plant, **{**BASELINE_READINGS, "moisture": 15.0})
         assert plant.moisture_status == STATE_LOW
 
         # Sensor goes unavailable → status reset
         hass.states.async_set("sensor.test_moisture", STATE_UNAVAILABLE)
-        await hass.async_block_till_done()
-        await update_plant_sensors(hass, init_integration.entry_id)
+        await update_plant_sensors(plant)
         assert plant.moisture_status is None
 
         # Value returns within hysteresis band → should be OK (no held state)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=21.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
+        await apply_and_update(plant, **{**BASELINE_READINGS, "moisture": 21.0})
         assert plant.moisture_status == STATE_OK
 
-    async def test_illuminance_high_holds_within_hysteresis_band(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test illuminance HIGH hysteresis (max-only check).
-
-        Default illuminance: min=0, max=100000, range=100000, band=5000.
-        Enters at >100000, clears at <95000.
-        """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Rise above max
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=110000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.illuminance_status == STATE_HIGH
-        assert plant.state == STATE_PROBLEM
-
-        # Drop within band (96000 >= 100000 - 5000 = 95000)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=96000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.illuminance_status == STATE_HIGH  # held
-        assert plant.state == STATE_PROBLEM
-
-        # Drop below band (94000 < 95000)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=94000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.illuminance_status == STATE_OK
-        assert plant.state == STATE_OK
-
     async def test_dli_low_holds_within_hysteresis_band(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        healthy_plant: PlantDevice,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test DLI LOW hysteresis.
 
         Default DLI: min=2, max=30, range=28, band=1.4.
         Enters at <2, clears at >3.4.
         """
-        from unittest.mock import PropertyMock, patch
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Set normal sensor values first
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-
-        def mock_dli(last_period):
-            """Context manager to mock DLI sensor with given last_period."""
-            mock_attrs = {"last_period": last_period}
-            return (
-                patch.object(
-                    type(plant.dli),
-                    "extra_state_attributes",
-                    new_callable=PropertyMock,
-                    return_value=mock_attrs,
-                ),
-                patch.object(
-                    type(plant.dli),
-                    "native_value",
-                    new_callable=PropertyMock,
-                    return_value=last_period,
-                ),
-                patch.object(
-                    type(plant.dli),
-                    "state",
-                    new_callable=PropertyMock,
-                    return_value=str(last_period),
-                ),
-            )
-
         # Step 1: Drop below min (1.0 < 2)
-        p1, p2, p3 = mock_dli(1.0)
-        with p1, p2, p3:
-            plant.update()
-        assert plant.dli_status == STATE_LOW
-        assert plant.state == STATE_PROBLEM
+        _set_dli_reading(monkeypatch, healthy_plant, 1.0)
+        healthy_plant.update()
+        assert healthy_plant.dli_status == STATE_LOW
+        assert healthy_plant.state == STATE_PROBLEM
 
         # Step 2: Rise within band (2.5 <= 2 + 1.4 = 3.4) → still LOW
-        p1, p2, p3 = mock_dli(2.5)
-        with p1, p2, p3:
-            plant.update()
-        assert plant.dli_status == STATE_LOW
-        assert plant.state == STATE_PROBLEM
+        _set_dli_reading(monkeypatch, healthy_plant, 2.5)
+        healthy_plant.update()
+        assert healthy_plant.dli_status == STATE_LOW
+        assert healthy_plant.state == STATE_PROBLEM
 
         # Step 3: Rise above band (4.0 > 3.4) → clears
-        p1, p2, p3 = mock_dli(4.0)
-        with p1, p2, p3:
-            plant.update()
-        assert plant.dli_status == STATE_OK
-        assert plant.state == STATE_OK
-
-    async def test_conductivity_hysteresis(
-        self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
-    ) -> None:
-        """Test conductivity hysteresis.
-
-        Default conductivity: min=500, max=3000, range=2500, band=125.
-        Enters LOW at <500, clears at >625.
-        """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # Drop below min
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=400.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.conductivity_status == STATE_LOW
-
-        # Rise within band (600 <= 500 + 125 = 625)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=600.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.conductivity_status == STATE_LOW  # held
-
-        # Rise above band (650 > 625)
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=650.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.conductivity_status == STATE_OK
+        _set_dli_reading(monkeypatch, healthy_plant, 4.0)
+        healthy_plant.update()
+        assert healthy_plant.dli_status == STATE_OK
+        assert healthy_plant.state == STATE_OK
 
     async def test_threshold_unavailable_preserves_status(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        healthy_plant: PlantDevice,
     ) -> None:
         """Test that unavailable threshold entities don't crash _check_threshold.
 
         When a threshold number entity has state 'unavailable', the plant
         should keep its current status rather than raising ValueError.
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
-        # First establish a known state
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=40.0,
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
-        )
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.state == STATE_OK
-        assert plant.moisture_status == STATE_OK
+        assert healthy_plant.state == STATE_OK
+        assert healthy_plant.moisture_status == STATE_OK
 
         # Make the min_moisture threshold entity unavailable
-        hass.states.async_set(plant.min_moisture.entity_id, STATE_UNAVAILABLE)
-        await hass.async_block_till_done()
+        hass.states.async_set(healthy_plant.min_moisture.entity_id, STATE_UNAVAILABLE)
 
         # Update should not crash — moisture_status should be preserved
-        await update_plant_sensors(hass, init_integration.entry_id)
-        assert plant.moisture_status == STATE_OK
+        await update_plant_sensors(healthy_plant)
+        assert healthy_plant.moisture_status == STATE_OK
 
     async def test_threshold_unknown_preserves_status(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that unknown threshold entities don't crash _check_threshold."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Establish a LOW moisture state
-        await set_external_sensor_states(
-            hass,
-            temperature=25.0,
-            moisture=5.0,  # Below min of 20
-            conductivity=1000.0,
-            illuminance=5000.0,
-            humidity=40.0,
+        await apply_and_update(
+            plant,
+            **{**BASELINE_READINGS, "moisture": 5.0},  # Below min of 20
         )
-        await update_plant_sensors(hass, init_integration.entry_id)
         assert plant.moisture_status == STATE_LOW
 
         # Make the max_moisture threshold entity unknown
         hass.states.async_set(plant.max_moisture.entity_id, STATE_UNKNOWN)
-        await hass.async_block_till_done()
 
         # Update should not crash — moisture_status should stay LOW
-        await update_plant_sensors(hass, init_integration.entry_id)
+        await update_plant_sensors(plant)
         assert plant.moisture_status == STATE_LOW
 
 
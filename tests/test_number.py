@@ -9,8 +9,8 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.plant import PlantDevice
 from custom_components.plant.const import (
-    ATTR_PLANT,
     ATTR_THRESHOLDS,
     DOMAIN,
     UNIT_DLI,
@@ -53,11 +53,9 @@ class TestMoistureThresholds:
 
     async def test_max_moisture_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max moisture threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_moisture
 
         assert threshold is not None
@@ -70,11 +68,9 @@ class TestMoistureThresholds:
 
     async def test_min_moisture_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min moisture threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_moisture
 
         assert threshold is not None
@@ -84,12 +80,9 @@ class TestMoistureThresholds:
 
     async def test_moisture_threshold_default_values(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test moisture threshold default values from config."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Default values from conftest: max=60, min=20
         assert plant.max_moisture.native_value == 60
         assert plant.min_moisture.native_value == 20
@@ -100,11 +93,9 @@ class TestTemperatureThresholds:
 
     async def test_max_temperature_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max temperature threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_temperature
 
         assert threshold is not None
@@ -115,11 +106,9 @@ class TestTemperatureThresholds:
 
     async def test_min_temperature_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min temperature threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_temperature
 
         assert threshold is not None
@@ -128,23 +117,18 @@ class TestTemperatureThresholds:
 
     async def test_temperature_threshold_default_values(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test temperature threshold default values from config."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Default values from conftest: max=40, min=10
         assert plant.max_temperature.native_value == 40
         assert plant.min_temperature.native_value == 10
 
     async def test_temperature_threshold_allows_negative_values(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that temperature thresholds allow negative values."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_temperature
 
         # Verify min_value allows negative temperatures
@@ -164,11 +148,9 @@ class TestConductivityThresholds:
 
     async def test_max_conductivity_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max conductivity threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_conductivity
 
         assert threshold is not None
@@ -182,11 +164,9 @@ class TestConductivityThresholds:
 
     async def test_min_conductivity_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min conductivity threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_conductivity
 
         assert threshold is not None
@@ -195,12 +175,9 @@ class TestConductivityThresholds:
 
     async def test_conductivity_threshold_default_values(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test conductivity threshold default values from config."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Default values from conftest: max=3000, min=500
         assert plant.max_conductivity.native_value == 3000
         assert plant.min_conductivity.native_value == 500
@@ -211,11 +188,9 @@ class TestIlluminanceThresholds:
 
     async def test_max_illuminance_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max illuminance threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_illuminance
 
         assert threshold is not None
@@ -227,11 +202,9 @@ class TestIlluminanceThresholds:
 
     async def test_min_illuminance_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min illuminance threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_illuminance
 
         assert threshold is not None
@@ -244,11 +217,9 @@ class TestHumidityThresholds:
 
     async def test_max_humidity_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max humidity threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_humidity
 
         assert threshold is not None
@@ -258,11 +229,9 @@ class TestHumidityThresholds:
 
     async def test_min_humidity_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min humidity threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_humidity
 
         assert threshold is not None
@@ -275,11 +244,9 @@ class TestDliThresholds:
 
     async def test_max_dli_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max DLI threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_dli
 
         assert threshold is not None
@@ -289,11 +256,9 @@ class TestDliThresholds:
 
     async def test_min_dli_threshold(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min DLI threshold entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_dli
 
         assert threshold is not None
@@ -302,12 +267,9 @@ class TestDliThresholds:
 
     async def test_dli_threshold_default_values(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test DLI threshold default values from config."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Default values from conftest: max=30, min=2
         assert plant.max_dli.native_value == 30
         assert plant.min_dli.native_value == 2
@@ -318,34 +280,25 @@ class TestThresholdEntityProperties:
 
     async def test_threshold_entity_category(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that threshold entities have CONFIG category."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         for threshold in plant.threshold_entities:
             assert threshold.entity_category == EntityCategory.CONFIG
 
     async def test_threshold_mode(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that threshold entities use BOX mode."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         for threshold in plant.threshold_entities:
             assert threshold.mode == NumberMode.BOX
 
     async def test_threshold_device_info(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that threshold entities have correct device info."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         for threshold in plant.threshold_entities:
             device_info = threshold.device_info
             assert "identifiers" in device_info
@@ -357,11 +310,9 @@ class TestThresholdStateChanges:
 
     async def test_set_native_value(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test setting threshold value programmatically."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_moisture
 
         await threshold.async_set_native_value(75)
@@ -369,11 +320,9 @@ class TestThresholdStateChanges:
 
     async def test_threshold_state_change(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test threshold responds to state changes."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_moisture
 
         # Simulate state change
@@ -387,10 +336,9 @@ class TestTemperatureUnitConversion:
     async def test_max_temperature_converts_fahrenheit_to_celsius(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max temperature converts from °F to °C."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_temperature
 
         # Set initial value to 68°F using the entity's method
@@ -411,10 +359,9 @@ class TestTemperatureUnitConversion:
     async def test_max_temperature_converts_celsius_to_fahrenheit(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test max temperature converts from °C to °F."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_temperature
 
         # Set initial value to 20°C using the entity's method
@@ -435,10 +382,9 @@ class TestTemperatureUnitConversion:
     async def test_min_temperature_converts_fahrenheit_to_celsius(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min temperature converts from °F to °C."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_temperature
 
         # Set initial value to 50°F using the entity's method
@@ -459,10 +405,9 @@ class TestTemperatureUnitConversion:
     async def test_min_temperature_converts_celsius_to_fahrenheit(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test min temperature converts from °C to °F."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.min_temperature
 
         # Set initial value to 10°C using the entity's method
@@ -483,10 +428,9 @@ class TestTemperatureUnitConversion:
     async def test_temperature_no_conversion_when_units_same(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test no conversion happens when unit stays the same."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_temperature
 
         # Get initial state
@@ -506,10 +450,9 @@ class TestTemperatureUnitConversion:
     async def test_temperature_no_conversion_when_old_unit_none(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test no conversion when old unit is None."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_temperature
 
         # Get initial state
@@ -529,10 +472,9 @@ class TestTemperatureUnitConversion:
     async def test_temperature_no_conversion_when_new_unit_none(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test no conversion when new unit is None."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         threshold = plant.max_temperature
 
         # Get initial state
@@ -555,34 +497,26 @@ class TestLuxToPpfdEntity:
 
     async def test_lux_to_ppfd_entity_created(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test lux_to_ppfd entity is created and added to plant."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         assert plant.lux_to_ppfd is not None
         assert "lux" in plant.lux_to_ppfd.name.lower()
         assert "ppfd" in plant.lux_to_ppfd.name.lower()
 
     async def test_lux_to_ppfd_default_value(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test lux_to_ppfd has correct default value for sunlight."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Default value is 0.0185 for sunlight
         assert plant.lux_to_ppfd.native_value == 0.0185
 
     async def test_lux_to_ppfd_entity_properties(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test lux_to_ppfd entity has correct properties."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         lux_to_ppfd = plant.lux_to_ppfd
 
         # Check min/max range is reasonable for different light sources
@@ -599,10 +533,9 @@ class TestLuxToPpfdEntity:
     async def test_lux_to_ppfd_can_be_changed(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test lux_to_ppfd value can be changed for grow lights."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         lux_to_ppfd = plant.lux_to_ppfd
 
         # Simulate changing to LED grow light value
@@ -28,7 +28,7 @@ from custom_components.plant.const import (
     FLOW_PLANT_INFO,
     OPB_DISPLAY_PID,
 )
-from custom_components.plant.plant_helpers import PlantHelper
+from custom_components.plant.plant_helpers import PlantHelper, _to_int
 
 from .fixtures.openplantbook_responses import (
     GET_RESULT_MONSTERA_DELICIOSA,
@@ -397,38 +397,28 @@ class TestToIntHelper:
 
     def test_to_int_with_int(self) -> None:
         """Test _to_int with integer input."""
-        from custom_components.plant.plant_helpers import _to_int
-
         assert _to_int(42, 0) == 42
         assert _to_int(0, 10) == 0
         assert _to_int(-5, 0) == -5
 
     def test_to_int_with_string(self) -> None:
         """Test _to_int with string input (common from OPB API)."""
-        from custom_components.plant.plant_helpers import _to_int
-
         assert _to_int("42", 0) == 42
         assert _to_int("100", 0) == 100
         assert _to_int("-10", 0) == -10
 
     def test_to_int_with_none(self) -> None:
         """Test _to_int with None returns default."""
-        from custom_components.plant.plant_helpers import _to_int
-
         assert _to_int(None, 50) == 50
         assert _to_int(None, 0) == 0
 
     def test_to_int_with_invalid_string(self) -> None:
         """Test _to_int with invalid string returns default."""
-        from custom_components.plant.plant_helpers import _to_int
-
         assert _to_int("not a number", 25) == 25
         assert _to_int("", 10) == 10
 
     def test_to_int_with_float_string(self) -> None:
         """Test _to_int with float string converts via float and rounds."""
-        from custom_components.plant.plant_helpers import _to_int
-
         # Float strings should be converted via float() then rounded
         assert _to_int("42.5", 0) == 42  # rounds to nearest even (banker's rounding)
         assert _to_int("42.6", 0) == 43
@@ -436,8 +426,6 @@ class TestToIntHelper:
 
     def test_to_int_with_float(self) -> None:
         """Test _to_int with actual float values."""
-        from custom_components.plant.plant_helpers import _to_int
-
         assert _to_int(42.5, 0) == 42
         assert _to_int(42.9, 0) == 42  # int() truncates, doesn't round
 
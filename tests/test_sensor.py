@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 from homeassistant.const import (
     STATE_UNAVAILABLE,
@@ -12,10 +14,20 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.plant import PlantDevice
 from custom_components.plant.const import (
     ATTR_PLANT,
     DEFAULT_LUX_TO_PPFD,
     DOMAIN,
+    FLOW_PLANT_INFO,
+    FLOW_SENSOR_CO2,
+    FLOW_SENSOR_CONDUCTIVITY,
+    FLOW_SENSOR_HUMIDITY,
+    FLOW_SENSOR_ILLUMINANCE,
+    FLOW_SENSOR_MOISTURE,
+    FLOW_SENSOR_SOIL_TEMPERATURE,
+    FLOW_SENSOR_TEMPERATURE,
+    STATE_HIGH,
     UNIT_DLI,
     UNIT_PPFD,
     UNIT_TOTAL_LIGHT_INTEGRAL,
@@ -45,11 +57,9 @@ class TestPlantCurrentSensors:
 
     async def test_temperature_sensor(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test temperature sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         assert sensor is not None
@@ -58,11 +68,9 @@ class TestPlantCurrentSensors:
 
     async def test_moisture_sensor(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test moisture sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_moisture
 
         assert sensor is not None
@@ -71,11 +79,9 @@ class TestPlantCurrentSensors:
 
     async def test_conductivity_sensor(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test conductivity sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_conductivity
 
         assert sensor is not None
@@ -83,11 +89,9 @@ class TestPlantCurrentSensors:
 
     async def test_illuminance_sensor(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test illuminance sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_illuminance
 
         assert sensor is not None
@@ -96,11 +100,9 @@ class TestPlantCurrentSensors:
 
     async def test_humidity_sensor(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test humidity sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_humidity
 
         assert sensor is not None
@@ -109,11 +111,9 @@ class TestPlantCurrentSensors:
 
     async def test_co2_sensor(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test CO2 sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_co2
 
         assert sensor is not None
@@ -122,11 +122,9 @@ class TestPlantCurrentSensors:
 
     async def test_soil_temperature_sensor(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test soil temperature sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_soil_temperature
 
         assert sensor is not None
@@ -136,10 +134,9 @@ class TestPlantCurrentSensors:
     async def test_sensor_tracks_external_sensor(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that plant sensor tracks external sensor state."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         # Set external sensor value
@@ -158,10 +155,9 @@ class TestPlantCurrentSensors:
     async def test_sensor_handles_unavailable_external(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test sensor handles unavailable external sensor."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         # Set external sensor to unavailable
@@ -177,10 +173,9 @@ class TestPlantCurrentSensors:
     async def test_sensor_handles_unknown_external(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test sensor handles unknown external sensor state."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         # Set external sensor to unknown
@@ -194,11 +189,9 @@ class TestPlantCurrentSensors:
 
     async def test_sensor_extra_state_attributes(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test sensor extra state attributes include external sensor."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         attrs = sensor.extra_state_attributes
@@ -209,10 +202,9 @@ class TestPlantCurrentSensors:
     async def test_replace_external_sensor(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test replacing the external sensor."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         # Create a new sensor
@@ -228,6 +220,43 @@ class TestPlantCurrentSensors:
 
         assert sensor.external_sensor == "sensor.new_temperature"
 
+    async def test_replace_external_sensor_stops_tracking_old(
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
+    ) -> None:
+        """Test the replaced external sensor no longer drives the meter."""
+        sensor = plant.sensor_temperature
+
+        await set_sensor_state(
+            hass, "sensor.new_temperature", 30, {"unit_of_measurement": "°C"}
+        )
+        sensor.replace_external_sensor("sensor.new_temperature")
+        await set_sensor_state(
+            hass, "sensor.new_temperature", 31, {"unit_of_measurement": "°C"}
+        )
+        assert sensor.native_value == "31"
+
+        await set_sensor_state(
+            hass, "sensor.test_temperature", 12, {"unit_of_measurement": "°C"}
+        )
+        assert sensor.native_value == "31"
+        assert set(sensor._tracker) == {sensor.entity_id, "sensor.new_temperature"}
+
+    async def test_replace_external_sensor_same_sensor_skips_write(
+        self,
+        plant: PlantDevice,
+    ) -> None:
+        """Test re-selecting the current external sensor does not write state."""
+        sensor = plant.sensor_temperature
+
+        with patch.object(sensor, "async_write_ha_state") as mock_write:
+            sensor.replace_external_sensor(sensor.external_sensor)
+            mock_write.assert_not_called()
+
+            sensor.replace_external_sensor(None)
+            mock_write.assert_called_once()
+
     async def test_sensor_no_external_sensor(
         self,
         hass: HomeAssistant,
@@ -246,10 +275,9 @@ class TestPlantCurrentSensors:
     async def test_sensor_handles_non_numeric_external(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test sensor handles non-numeric external sensor state."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         # Set external sensor to non-numeric value
@@ -269,10 +297,9 @@ class TestPlantCurrentSensors:
     async def test_sensor_handles_missing_external_entity(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test sensor handles missing external sensor entity."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         # Replace with a sensor that doesn't exist
@@ -291,22 +318,18 @@ class TestPpfdSensor:
 
     async def test_ppfd_sensor_created(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that PPFD sensor is created."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         assert plant.ppfd is not None
         assert "ppfd" in plant.ppfd.name.lower()
 
     async def test_ppfd_calculation(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test PPFD calculation from illuminance."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         ppfd_sensor = plant.ppfd
         illuminance_sensor = plant.sensor_illuminance
 
@@ -334,10 +357,9 @@ class TestPpfdSensor:
     async def test_ppfd_with_unavailable_illuminance(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test PPFD calculation when illuminance is unavailable."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         ppfd_sensor = plant.ppfd
 
         # Set illuminance to unavailable
@@ -352,11 +374,9 @@ class TestPpfdSensor:
 
     async def test_ppfd_unit(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test PPFD sensor unit of measurement."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         ppfd_sensor = plant.ppfd
 
         assert ppfd_sensor.native_unit_of_measurement == UNIT_PPFD
@@ -367,19 +387,15 @@ class TestDliSensor:
 
     async def test_dli_sensor_created(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that DLI sensor is created."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         assert plant.dli is not None
         assert "dli" in plant.dli.name.lower()
 
     async def test_dli_unit(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test DLI sensor unit of measurement.
 
@@ -387,7 +403,6 @@ class TestDliSensor:
         sensor on every state change. We override native_unit_of_measurement
         property to always return the correct DLI unit.
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         dli_sensor = plant.dli
 
         # Verify the property returns the correct unit
@@ -399,19 +414,15 @@ class TestTotalLightIntegralSensor:
 
     async def test_total_integral_sensor_created(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that total light integral sensor is created."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         assert plant.total_integral is not None
         assert "integral" in plant.total_integral.name.lower()
 
     async def test_total_integral_has_unit_override(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test total integral sensor has unit calculation override.
 
@@ -419,8 +430,6 @@ class TestTotalLightIntegralSensor:
         unit to source unit. We override _calculate_unit to return mol/m²
         (the seconds cancel out when integrating mol/s⋅m² over time).
         """
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Verify the sensor exists and is properly set up
         assert plant.total_integral is not None
         assert plant.total_integral.name is not None
@@ -439,12 +448,9 @@ class TestSensorDeviceInfo:
 
     async def test_sensor_device_info(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that sensors have correct device info."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         for sensor in plant.meter_entities:
             device_info = sensor.device_info
             assert "identifiers" in device_info
@@ -452,12 +458,9 @@ class TestSensorDeviceInfo:
 
     async def test_integral_sensor_device_info(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that integral sensors have correct device info."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         for sensor in plant.integral_entities:
             device_info = sensor.device_info
             assert "identifiers" in device_info
@@ -470,10 +473,9 @@ class TestSensorEntityIdRename:
     async def test_external_sensor_rename_updates_tracking(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that renaming an external sensor updates the tracking."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         old_entity_id = "sensor.test_temperature"
@@ -508,10 +510,9 @@ class TestSensorEntityIdRename:
     async def test_non_rename_update_does_not_change_tracking(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that non-rename updates don't affect tracking."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         original_external = sensor.external_sensor
@@ -533,10 +534,9 @@ class TestSensorEntityIdRename:
     async def test_unrelated_entity_rename_does_not_change_tracking(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that renaming an unrelated entity doesn't affect tracking."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         original_external = sensor.external_sensor
@@ -559,10 +559,9 @@ class TestSensorEntityIdRename:
     async def test_total_integral_source_rename_updates_tracking(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that renaming the PPFD sensor updates the total integral tracking."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         integral_sensor = plant.total_integral
         ppfd_sensor = plant.ppfd
 
@@ -585,10 +584,9 @@ class TestSensorEntityIdRename:
     async def test_dli_source_rename_updates_tracking(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that renaming the integral sensor updates the DLI tracking."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         dli_sensor = plant.dli
         integral_sensor = plant.total_integral
 
@@ -614,10 +612,9 @@ class TestSensorRemovalAndConfigPersistence:
     async def test_external_sensor_deletion_clears_reference(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that deleting an external sensor clears the reference."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         original_external = "sensor.test_temperature"
@@ -639,10 +636,9 @@ class TestSensorRemovalAndConfigPersistence:
     async def test_unrelated_sensor_deletion_does_not_clear_reference(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that deleting an unrelated sensor doesn't affect tracking."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         original_external = sensor.external_sensor
@@ -664,14 +660,9 @@ class TestSensorRemovalAndConfigPersistence:
         self,
         hass: HomeAssistant,
         init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that replacing a sensor updates the config entry."""
-        from custom_components.plant.const import (
-            FLOW_PLANT_INFO,
-            FLOW_SENSOR_TEMPERATURE,
-        )
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_temperature
 
         original_external = "sensor.test_temperature"
@@ -702,14 +693,9 @@ class TestSensorRemovalAndConfigPersistence:
         self,
         hass: HomeAssistant,
         init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that removing a sensor (setting to None) updates the config entry."""
-        from custom_components.plant.const import (
-            FLOW_PLANT_INFO,
-            FLOW_SENSOR_MOISTURE,
-        )
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_moisture
 
         original_external = "sensor.test_moisture"
@@ -731,14 +717,9 @@ class TestSensorRemovalAndConfigPersistence:
         self,
         hass: HomeAssistant,
         init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that deleting an external sensor also updates the config entry."""
-        from custom_components.plant.const import (
-            FLOW_PLANT_INFO,
-            FLOW_SENSOR_ILLUMINANCE,
-        )
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         sensor = plant.sensor_illuminance
 
         original_external = "sensor.test_illuminance"
@@ -764,22 +745,9 @@ class TestSensorRemovalAndConfigPersistence:
 
     async def test_all_sensors_have_config_keys(
         self,
-        hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that all current status sensors have config keys defined."""
-        from custom_components.plant.const import (
-            FLOW_SENSOR_CO2,
-            FLOW_SENSOR_CONDUCTIVITY,
-            FLOW_SENSOR_HUMIDITY,
-            FLOW_SENSOR_ILLUMINANCE,
-            FLOW_SENSOR_MOISTURE,
-            FLOW_SENSOR_SOIL_TEMPERATURE,
-            FLOW_SENSOR_TEMPERATURE,
-        )
-
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Verify all sensors have the expected config keys
         assert plant.sensor_temperature._config_key == FLOW_SENSOR_TEMPERATURE
         assert plant.sensor_moisture._config_key == FLOW_SENSOR_MOISTURE
@@ -796,10 +764,9 @@ class TestDliSensorsWhenIlluminanceRemoved:
     async def test_ppfd_becomes_none_when_illuminance_external_removed(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that PPFD is disabled when illuminance external sensor is removed."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         illuminance_sensor = plant.sensor_illuminance
         ppfd_sensor = plant.ppfd
 
@@ -831,10 +798,9 @@ class TestDliSensorsWhenIlluminanceRemoved:
     async def test_illuminance_sensor_deletion_affects_ppfd(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test that deleting the illuminance external sensor affects PPFD."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         illuminance_sensor = plant.sensor_illuminance
         ppfd_sensor = plant.ppfd
 
@@ -866,10 +832,11 @@ class TestPpfdSensorWithPpfdSource:
     """Tests for PPFD sensor when source already provides PPFD (e.g., FYTA sensors)."""
 
     async def test_ppfd_passthrough_when_source_is_ppfd(
-        self, hass: HomeAssistant, init_integration: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
     ) -> None:
         """Test PPFD passes through unchanged when source provides PPFD."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         ppfd_sensor = plant.ppfd
         illuminance_sensor = plant.sensor_illuminance
 
@@ -894,10 +861,11 @@ class TestPpfdSensorWithPpfdSource:
         assert ppfd_sensor.native_value == pytest.approx(ppfd_value, rel=0.01)
 
     async def test_ppfd_still_converts_lux_source(
-        self, hass: HomeAssistant, init_integration: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
     ) -> None:
         """Test PPFD still converts from lux when source provides lux."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         ppfd_sensor = plant.ppfd
         illuminance_sensor = plant.sensor_illuminance
 
@@ -919,10 +887,11 @@ class TestPpfdSensorWithPpfdSource:
         assert ppfd_sensor.native_value == pytest.approx(expected_ppfd, rel=0.01)
 
     async def test_ppfd_detects_various_mol_units(
-        self, hass: HomeAssistant, init_integration: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
     ) -> None:
         """Test PPFD detection works for various mol unit formats."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         ppfd_sensor = plant.ppfd
         illuminance_sensor = plant.sensor_illuminance
 
@@ -943,10 +912,11 @@ class TestPpfdSensorWithPpfdSource:
             ), f"Failed for unit: {unit}"
 
     async def test_ppfd_source_detection_flag(
-        self, hass: HomeAssistant, init_integration: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
     ) -> None:
         """Test that _source_is_ppfd flag is correctly set."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         ppfd_sensor = plant.ppfd
         illuminance_sensor = plant.sensor_illuminance
 
@@ -979,10 +949,11 @@ class TestProblemDetectionWithPpfdSource:
     """Tests for problem detection when using PPFD source."""
 
     async def test_illuminance_status_skipped_for_ppfd_source(
-        self, hass: HomeAssistant, init_integration: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
     ) -> None:
         """Test that illuminance_status is None when source is PPFD."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         illuminance_sensor = plant.sensor_illuminance
 
         # Set up PPFD source with high value that would trigger alert with lux
@@ -1002,10 +973,11 @@ class TestProblemDetectionWithPpfdSource:
         assert plant.illuminance_status is None
 
     async def test_illuminance_status_works_for_lux_source(
-        self, hass: HomeAssistant, init_integration: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
     ) -> None:
         """Test that illuminance_status works normally for lux sources."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         illuminance_sensor = plant.sensor_illuminance
 
         # Set high lux value (above typical max threshold of 100000)
@@ -1021,15 +993,14 @@ class TestProblemDetectionWithPpfdSource:
         await hass.async_block_till_done()
 
         # illuminance_status should be STATE_HIGH for excessive lux
-        from custom_components.plant.const import STATE_HIGH
-
         assert plant.illuminance_status == STATE_HIGH
 
     async def test_plant_state_not_problem_for_ppfd_high_value(
-        self, hass: HomeAssistant, init_integration: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
     ) -> None:
         """Test that plant state is not 'problem' when PPFD value is high."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         illuminance_sensor = plant.sensor_illuminance
 
         # Set up PPFD source with value that would be way over lux threshold
@@ -5,8 +5,8 @@ from __future__ import annotations
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.plant import PlantDevice
 from custom_components.plant.const import (
-    ATTR_PLANT,
     DOMAIN,
     SERVICE_REPLACE_SENSOR,
 )
@@ -26,10 +26,9 @@ class TestReplaceSensorService:
     async def test_replace_sensor_valid(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test replacing sensor with valid inputs."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         meter_entity = plant.sensor_temperature.entity_id
 
         # Create a new sensor to replace with
@@ -59,10 +58,9 @@ class TestReplaceSensorService:
     async def test_replace_sensor_with_empty_clears_sensor(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test replacing sensor with empty string clears the external sensor."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         meter_entity = plant.sensor_temperature.entity_id
 
         # Call the service with empty new_sensor
@@ -108,10 +106,9 @@ class TestReplaceSensorService:
     async def test_replace_sensor_invalid_new_sensor_not_sensor(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test replace sensor rejects non-sensor entities."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         meter_entity = plant.sensor_temperature.entity_id
 
         # Create a non-sensor entity
@@ -136,10 +133,9 @@ class TestReplaceSensorService:
     async def test_replace_sensor_nonexistent_new_sensor(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test replace sensor with nonexistent new sensor is rejected."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         meter_entity = plant.sensor_temperature.entity_id
 
         # Call the service with nonexistent sensor
@@ -180,11 +176,9 @@ class TestReplaceSensorService:
     async def test_replace_multiple_sensors(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
     ) -> None:
         """Test replacing multiple sensors."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Create new sensors
         hass.states.async_set("sensor.new_temp", "26", {"unit_of_measurement": "°C"})
         hass.states.async_set("sensor.new_moisture", "50", {"unit_of_measurement": "%"})
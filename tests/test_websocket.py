@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.plant import PlantDevice
 from custom_components.plant.const import (
     ATTR_CONDUCTIVITY,
     ATTR_CURRENT,
@@ -27,12 +29,10 @@ class TestWebsocketGetInfo:
     async def test_websocket_get_info_success(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
         hass_ws_client,
     ) -> None:
         """Test successful websocket get_info request."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Ensure plant is complete
         plant.plant_complete = True
 
@@ -62,11 +62,10 @@ class TestWebsocketGetInfo:
     async def test_websocket_get_info_entity_structure(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
         hass_ws_client,
     ) -> None:
         """Test websocket response structure for each measurement type."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
         plant.plant_complete = True
 
         client = await hass_ws_client(hass)
@@ -91,6 +90,34 @@ class TestWebsocketGetInfo:
         assert "unit_of_measurement" in temp_data
         assert ATTR_SENSOR in temp_data
 
+    async def test_websocket_get_info_icon_follows_registry(
+        self,
+        hass: HomeAssistant,
+        plant: PlantDevice,
+        hass_ws_client,
+    ) -> None:
+        """Test a registry icon change is picked up after the icon was cached."""
+        plant.plant_complete = True
+        client = await hass_ws_client(hass)
+
+        async def get_dli_icon(msg_id: int) -> str | None:
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "plant/get_info",
+                    "entity_id": plant.entity_id,
+                }
+            )
+            response = await client.receive_json()
+            return response["result"]["result"][ATTR_DLI]["icon"]
+
+        assert await get_dli_icon(1) == plant.dli.icon
+
+        er.async_get(hass).async_update_entity(plant.dli.entity_id, icon="mdi:cactus")
+        await hass.async_block_till_done()
+
+        assert await get_dli_icon(2) == "mdi:cactus"
+
     async def test_websocket_get_info_entity_not_found(
         self,
         hass: HomeAssistant,
@@ -140,12 +167,10 @@ class TestWebsocketGetInfo:
     async def test_websocket_get_info_plant_not_complete(
         self,
         hass: HomeAssistant,
-        init_integration: MockConfigEntry,
+        plant: PlantDevice,
         hass_ws_client,
     ) -> None:
         """Test websocket returns empty result when plant not complete."""
-        plant = hass.data[DOMAIN][init_integration.entry_id][ATTR_PLANT]
-
         # Set plant as not complete
         plant.plant_complete = False
 